@@ -0,0 +1,68 @@
+"""Benchmark get_connection_summary on a synthetic /proc/net table.
+
+Usage:
+    python benchmarks/bench_connection_summary.py [--lines 200000] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from platforms.linux import LinuxDeviceProvider  # noqa: E402
+
+HEADER = (
+    "  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt"
+    "   uid  timeout inode\n"
+)
+ROW = (
+    "{sl:>6}: {local} {remote} {state} 00000000:00000000 00:00000000 00000000"
+    "  1000        0 {inode} 1 0000000000000000 20 4 30 10 -1\n"
+)
+STATES = ['01'] * 6 + ['06'] * 3 + ['08', '0A']
+
+
+def write_table(path: str, lines: int, seed: int = 0) -> None:
+    """Write a synthetic /proc/net/tcp table with the given number of sockets."""
+    rng = random.Random(seed)
+    local_ports = [80, 443, 5432, 6379, 8080]
+    with open(path, 'w') as f:
+        f.write(HEADER)
+        for i in range(lines):
+            local = f"0100000A:{rng.choice(local_ports):04X}"
+            remote_ip = (rng.randrange(1, 255) << 24) | (rng.randrange(8) << 16) | 0x0A
+            remote = f"{remote_ip:08X}:{rng.randrange(1024, 65535):04X}"
+            f.write(ROW.format(
+                sl=i, local=local, remote=remote, state=rng.choice(STATES), inode=100000 + i
+            ))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--lines', type=int, default=200_000, help="Sockets in the table")
+    parser.add_argument('--repeat', type=int, default=5, help="Number of timed runs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as proc_net:
+        write_table(os.path.join(proc_net, 'tcp'), args.lines)
+        LinuxDeviceProvider.PROC_NET_PATH = proc_net
+        provider = LinuxDeviceProvider()
+
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            summary = provider.get_connection_summary()
+            timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    print(f"sockets:  {summary.total}")
+    print(f"states:   {summary.by_state}")
+    print(f"best:     {best * 1000:.1f} ms ({summary.total / best:,.0f} sockets/s)")
+    print(f"median:   {sorted(timings)[len(timings) // 2] * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
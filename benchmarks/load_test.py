@@ -0,0 +1,280 @@
+"""Load-test a DeviceMCP server process with concurrent MCP clients.
+
+Spawns server.py locally (stdio, or HTTP with --transport http), drives a
+weighted mix of tool calls from N concurrent clients for a fixed duration and
+reports throughput, latency percentiles and server RSS over time. Runs fully
+offline.
+
+Usage:
+    python benchmarks/load_test.py [--transport stdio|http] [--clients 8]
+        [--duration 10] [--mix get_device_info=1,get_storage_info=1,get_system_summary=1]
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import psutil
+from fastmcp import Client
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVER = os.path.join(ROOT, "server.py")
+DEFAULT_MIX = "get_device_info=1,get_storage_info=1,get_system_summary=1"
+# Pause after a failed call so a failing tool doesn't turn into a busy loop
+ERROR_BACKOFF = 0.05
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parse "tool=weight,tool=weight" into a dict."""
+    weights = {}
+    for part in mix.split(","):
+        tool, _, weight = part.strip().partition("=")
+        if tool:
+            weights[tool] = float(weight) if weight else 1.0
+    if not weights:
+        raise ValueError("Empty tool mix")
+    return weights
+
+
+def percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    index = min(max(math.ceil(fraction * len(sorted_values)) - 1, 0), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_for_port(port: int, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise TimeoutError(f"Server did not listen on port {port} within {timeout}s")
+
+
+def _find_stdio_server() -> Optional[psutil.Process]:
+    """Find the server.py process spawned by the stdio transport."""
+    for child in psutil.Process().children(recursive=True):
+        try:
+            if SERVER in child.cmdline():
+                return child
+        except psutil.Error:
+            continue
+    return None
+
+
+async def _sample_rss(
+    get_process,
+    samples: List[Tuple[float, int]],
+    start: float,
+    interval: float,
+    stop: asyncio.Event
+) -> None:
+    while not stop.is_set():
+        process = get_process()
+        if process is not None:
+            try:
+                samples.append((round(time.monotonic() - start, 2), process.memory_info().rss))
+            except psutil.Error:
+                pass
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def _client_worker(
+    client: Client,
+    weights: Dict[str, float],
+    end: float,
+    rng: random.Random,
+    latencies: Dict[str, List[float]],
+    errors: Dict[str, int]
+) -> None:
+    tools, tool_weights = list(weights), list(weights.values())
+    while time.monotonic() < end:
+        tool = rng.choices(tools, tool_weights)[0]
+        start = time.perf_counter()
+        try:
+            await client.call_tool(tool, {})
+        except Exception:
+            errors[tool] = errors.get(tool, 0) + 1
+            if not client.is_connected():
+                # The session is gone; every further call would fail at once
+                break
+            await asyncio.sleep(ERROR_BACKOFF)
+            continue
+        latencies.setdefault(tool, []).append(time.perf_counter() - start)
+
+
+async def run_load_test(
+    transport: str = "stdio",
+    clients: int = 8,
+    duration: float = 10.0,
+    mix: str = DEFAULT_MIX,
+    rss_interval: float = 0.5,
+    seed: int = 0
+) -> Dict:
+    """
+    Run a load test against a freshly spawned server.py.
+
+    Args:
+        transport: "stdio" (clients share one session) or "http" (one session per client)
+        clients: Number of concurrent simulated clients
+        duration: Seconds to drive load for
+        mix: Weighted tool mix, "tool=weight,..."
+        rss_interval: Seconds between server RSS samples
+        seed: Random seed for the tool mix
+
+    Returns:
+        dict: Throughput, latency percentiles (overall and per tool), errors and RSS samples
+    """
+    weights = parse_mix(mix)
+    server_process: Optional[subprocess.Popen] = None
+    ps_process: Optional[psutil.Process] = None
+
+    if transport == "http":
+        port = _free_port()
+        server_process = subprocess.Popen(
+            [sys.executable, SERVER, "--transport", "http", "--port", str(port)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        _wait_for_port(port, timeout=30)
+        ps_process = psutil.Process(server_process.pid)
+        sessions = [Client(f"http://127.0.0.1:{port}/mcp") for _ in range(clients)]
+    else:
+        sessions = [Client(SERVER)]
+
+    def get_process():
+        nonlocal ps_process
+        if ps_process is None:
+            ps_process = _find_stdio_server()
+        return ps_process
+
+    latencies: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    rss_samples: List[Tuple[float, int]] = []
+
+    try:
+        for session in sessions:
+            await session.__aenter__()
+
+        stop = asyncio.Event()
+        start = time.monotonic()
+        sampler = asyncio.create_task(
+            _sample_rss(get_process, rss_samples, start, rss_interval, stop)
+        )
+        end = start + duration
+        await asyncio.gather(*(
+            _client_worker(
+                sessions[i % len(sessions)], weights, end,
+                random.Random(seed + i), latencies, errors
+            )
+            for i in range(clients)
+        ))
+        elapsed = time.monotonic() - start
+        stop.set()
+        await sampler
+    finally:
+        for session in sessions:
+            try:
+                await session.__aexit__(None, None, None)
+            except Exception:
+                pass
+        if server_process is not None:
+            server_process.terminate()
+            server_process.wait(timeout=10)
+
+    def summarize(values: List[float]) -> Dict:
+        values = sorted(values)
+        return {
+            "requests": len(values),
+            "p50_ms": _ms(percentile(values, 0.50)),
+            "p99_ms": _ms(percentile(values, 0.99)),
+            "p999_ms": _ms(percentile(values, 0.999)),
+            "max_ms": _ms(values[-1] if values else None),
+        }
+
+    all_latencies = [value for values in latencies.values() for value in values]
+    overall = summarize(all_latencies)
+    return {
+        "transport": transport,
+        "clients": clients,
+        "duration_seconds": round(elapsed, 3),
+        "throughput_rps": round(len(all_latencies) / elapsed, 1),
+        "errors": errors,
+        **overall,
+        "per_tool": {tool: summarize(values) for tool, values in sorted(latencies.items())},
+        "rss_samples": rss_samples,
+    }
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+def print_report(result: Dict) -> None:
+    """Print a human-readable load test report."""
+    print(f"transport:  {result['transport']} ({result['clients']} clients, "
+          f"{result['duration_seconds']}s)")
+    print(f"throughput: {result['throughput_rps']} req/s ({result['requests']} requests, "
+          f"{sum(result['errors'].values())} errors)")
+    print(f"latency:    p50 {result['p50_ms']} ms  p99 {result['p99_ms']} ms  "
+          f"p999 {result['p999_ms']} ms  max {result['max_ms']} ms")
+    print()
+    print(f"{'tool':<24}{'requests':>10}{'p50 ms':>10}{'p99 ms':>10}{'p999 ms':>10}")
+    for tool, stats in result["per_tool"].items():
+        print(f"{tool:<24}{stats['requests']:>10}{stats['p50_ms']:>10}"
+              f"{stats['p99_ms']:>10}{stats['p999_ms']:>10}")
+    if result["rss_samples"]:
+        print()
+        print("server RSS:")
+        for elapsed, rss in result["rss_samples"]:
+            print(f"  {elapsed:>7.2f}s  {rss / (1024 * 1024):8.1f} MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test a DeviceMCP server process")
+    parser.add_argument("--transport", choices=["stdio", "http"], default="stdio")
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent simulated clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Weighted tool mix, tool=weight,...")
+    parser.add_argument("--rss-interval", type=float, default=0.5,
+                        help="Seconds between server RSS samples")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the tool mix")
+    parser.add_argument("--json", action="store_true", help="Print the raw result as JSON")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_load_test(
+        transport=args.transport,
+        clients=args.clients,
+        duration=args.duration,
+        mix=args.mix,
+        rss_interval=args.rss_interval,
+        seed=args.seed
+    ))
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_report(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,56 @@
 """Core module for DeviceMCP."""
 from .base import DeviceInfoProvider
-from .models import DeviceInfo, BatteryInfo, StorageInfo, MemoryInfo
+from .models import (
+    DeviceInfo,
+    BatteryInfo,
+    StorageInfo,
+    MemoryInfo,
+    HugePagePool,
+    NumaNodeInfo,
+    MemoryTopology,
+    DirectoryUsage,
+    DiskUsageScan,
+    PortConnections,
+    RemoteHostConnections,
+    ConnectionSummary,
+    FleetHostResult,
+    ProfiledFunction,
+    AllocationSite,
+    ProfileReport,
+    MetricSamplingRate,
+    SamplingReport,
+    TemperatureSensor,
+    FanSensor,
+    ThermalInfo,
+    DeviceCapabilities,
+    CgroupUsage,
+    ContainerUsage
+)
 
 __all__ = [
     "DeviceInfoProvider",
     "DeviceInfo",
     "BatteryInfo",
     "StorageInfo",
-    "MemoryInfo"
+    "MemoryInfo",
+    "HugePagePool",
+    "NumaNodeInfo",
+    "MemoryTopology",
+    "DirectoryUsage",
+    "DiskUsageScan",
+    "PortConnections",
+    "RemoteHostConnections",
+    "ConnectionSummary",
+    "FleetHostResult",
+    "ProfiledFunction",
+    "AllocationSite",
+    "ProfileReport",
+    "MetricSamplingRate",
+    "SamplingReport",
+    "TemperatureSensor",
+    "FanSensor",
+    "ThermalInfo",
+    "DeviceCapabilities",
+    "CgroupUsage",
+    "ContainerUsage"
 ]
\ No newline at end of file
@@ -1,12 +1,76 @@
 """Abstract base classes for platform implementations."""
+import time
 from abc import ABC, abstractmethod
-from typing import List
-from .models import DeviceInfo, BatteryInfo, StorageInfo, MemoryInfo
+from typing import Dict, List
+import psutil
+from .models import (
+    DeviceInfo,
+    BatteryInfo,
+    StorageInfo,
+    MemoryInfo,
+    MemoryTopology,
+    ConnectionSummary,
+    ThermalInfo,
+    TemperatureSensor,
+    FanSensor,
+    DeviceCapabilities,
+    ContainerUsage
+)
 
 
 class DeviceInfoProvider(ABC):
     """Abstract base class for device information providers."""
 
+    def __init__(self):
+        # Probe once so calls can skip sources that cannot exist on this device
+        self._capabilities = self.probe_capabilities()
+
+    def probe_capabilities(self) -> DeviceCapabilities:
+        """
+        Probe which optional binaries, sensors and system paths are available.
+
+        Runs when the provider is created; call again to re-probe, e.g. after
+        installing termux-api or attaching a battery.
+
+        Returns:
+            DeviceCapabilities: Freshly probed capabilities
+        """
+        self._capabilities = DeviceCapabilities(
+            capabilities=self._probe_capabilities(),
+            probed_at=time.time()
+        )
+        return self._capabilities
+
+    def get_capabilities(self) -> DeviceCapabilities:
+        """
+        Get the capabilities found by the last probe.
+
+        Returns:
+            DeviceCapabilities: Probed capabilities
+        """
+        return self._capabilities
+
+    def has_capability(self, name: str) -> bool:
+        """
+        Check whether a capability was found by the last probe.
+
+        Args:
+            name: Capability name (e.g. "battery")
+
+        Returns:
+            bool: True if the capability is available
+        """
+        return self._capabilities.capabilities.get(name, False)
+
+    def _probe_capabilities(self) -> Dict[str, bool]:
+        """
+        Probe platform-specific capabilities.
+
+        Returns:
+            Dict[str, bool]: Capability name to availability
+        """
+        return {}
+
     @abstractmethod
     def get_device_info(self) -> DeviceInfo:
         """
@@ -48,4 +112,100 @@ class DeviceInfoProvider(ABC):
         Returns:
             MemoryInfo: Memory information object
         """
-        pass
\ No newline at end of file
+        pass
+
+    def get_thermal_info(self) -> ThermalInfo:
+        """
+        Get temperature and fan sensor readings.
+
+        Returns:
+            ThermalInfo: Thermal information object (has_sensors is False
+            where psutil has no sensor support)
+        """
+        return self._get_psutil_thermal_info(
+            temperatures=hasattr(psutil, "sensors_temperatures"),
+            fans=hasattr(psutil, "sensors_fans")
+        )
+
+    def _get_psutil_thermal_info(self, temperatures: bool = True, fans: bool = True) -> ThermalInfo:
+        """
+        Get temperature and fan information through psutil.
+
+        Args:
+            temperatures: Whether to read psutil.sensors_temperatures
+            fans: Whether to read psutil.sensors_fans
+
+        Returns:
+            ThermalInfo: Thermal information object
+        """
+        temperature_sensors = []
+        fan_sensors = []
+
+        if temperatures:
+            for chip, entries in psutil.sensors_temperatures().items():
+                for index, entry in enumerate(entries, 1):
+                    temperature_sensors.append(TemperatureSensor(
+                        chip=chip,
+                        label=entry.label or f"temp{index}",
+                        current_celsius=entry.current,
+                        high_celsius=entry.high,
+                        critical_celsius=entry.critical
+                    ))
+
+        if fans:
+            for chip, entries in psutil.sensors_fans().items():
+                for index, entry in enumerate(entries, 1):
+                    fan_sensors.append(FanSensor(
+                        chip=chip,
+                        label=entry.label or f"fan{index}",
+                        rpm=int(entry.current)
+                    ))
+
+        return ThermalInfo(
+            has_sensors=bool(temperature_sensors or fan_sensors),
+            temperatures=temperature_sensors,
+            fans=fan_sensors
+        )
+
+    def get_memory_topology(self) -> MemoryTopology:
+        """
+        Get per-NUMA-node memory topology.
+
+        Returns:
+            MemoryTopology: Memory topology object (numa_available is False
+            on platforms that do not expose NUMA topology)
+        """
+        return MemoryTopology(numa_available=False, node_count=0, nodes=[])
+
+    def get_connection_summary(self, top_n: int = 10) -> ConnectionSummary:
+        """
+        Get network connection counts by state, local port and remote host.
+
+        Args:
+            top_n: Number of local ports and remote hosts to report
+
+        Returns:
+            ConnectionSummary: Connection summary object (available is False
+            on platforms without connection summaries)
+        """
+        return ConnectionSummary(available=False, total=0)
+
+    def get_container_usage(
+        self,
+        top_n: int = 10,
+        sort_by: str = "memory",
+        leaf_only: bool = True
+    ) -> ContainerUsage:
+        """
+        Get memory, CPU and IO usage per container (cgroup).
+
+        Args:
+            top_n: Number of cgroups to report
+            sort_by: Rank cgroups by "memory", "cpu" or "io"
+            leaf_only: Only rank leaf cgroups, whose usage is not the sum of children
+
+        Returns:
+            ContainerUsage: Per-cgroup usage object (cgroup_v2 is False and no
+            cgroups are reported on platforms without cgroups)
+        """
+        return ContainerUsage(cgroup_v2=False, cgroup_count=0, sort_by=sort_by, cgroups=[])
@@ -1,5 +1,5 @@
 """Data models for device information."""
-from typing import Optional, List
+from typing import Any, Optional, List, Dict
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -92,4 +92,337 @@ class MemoryInfo(BaseModel):
     used_bytes: int = Field(..., description="Used RAM in bytes")
     usage_percent: float = Field(..., description="RAM usage percentage")
     swap_total_bytes: Optional[int] = Field(None, description="Total swap memory in bytes")
-    swap_used_bytes: Optional[int] = Field(None, description="Used swap memory in bytes")
\ No newline at end of file
+    swap_used_bytes: Optional[int] = Field(None, description="Used swap memory in bytes")
+
+
+class HugePagePool(BaseModel):
+    """Hugepage pool information model."""
+
+    page_size_bytes: int = Field(..., description="Size of each hugepage in bytes")
+    total_pages: int = Field(..., description="Number of hugepages in the pool")
+    free_pages: int = Field(..., description="Number of free hugepages in the pool")
+    surplus_pages: int = Field(0, description="Number of surplus (overcommitted) hugepages")
+
+
+class NumaNodeInfo(BaseModel):
+    """NUMA node memory information model."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "node_id": 0,
+                "cpus": [0, 1, 2, 3],
+                "total_bytes": 68719476736,
+                "free_bytes": 34359738368,
+                "used_bytes": 34359738368,
+                "usage_percent": 50.0,
+                "hugepages": [
+                    {
+                        "page_size_bytes": 2097152,
+                        "total_pages": 512,
+                        "free_pages": 128,
+                        "surplus_pages": 0
+                    }
+                ],
+                "distances": [10, 21]
+            }
+        }
+    )
+
+    node_id: int = Field(..., description="NUMA node identifier")
+    cpus: List[int] = Field(default_factory=list, description="CPUs attached to this node")
+    total_bytes: int = Field(..., description="Total node memory in bytes")
+    free_bytes: int = Field(..., description="Free node memory in bytes")
+    used_bytes: int = Field(..., description="Used node memory in bytes")
+    usage_percent: float = Field(..., description="Node memory usage percentage")
+    hugepages: List[HugePagePool] = Field(default_factory=list, description="Hugepage pools on this node")
+    distances: List[int] = Field(default_factory=list, description="Relative access distance to each node")
+
+
+class MemoryTopology(BaseModel):
+    """NUMA memory topology model."""
+
+    numa_available: bool = Field(..., description="Whether NUMA topology information is available")
+    node_count: int = Field(..., description="Number of NUMA nodes")
+    nodes: List[NumaNodeInfo] = Field(default_factory=list, description="Per-node memory information")
+
+
+class DirectoryUsage(BaseModel):
+    """Directory disk usage model."""
+
+    path: str = Field(..., description="Directory path")
+    depth: int = Field(..., description="Depth below the scanned root (1 = direct child)")
+    size_bytes: int = Field(..., description="Disk usage of the directory subtree in bytes")
+    file_count: int = Field(..., description="Number of files in the directory subtree")
+
+
+class DiskUsageScan(BaseModel):
+    """Directory-size scan result model."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "root": "/var",
+                "total_bytes": 12884901888,
+                "file_count": 48213,
+                "dir_count": 5120,
+                "entries_scanned": 53333,
+                "error_count": 2,
+                "elapsed_seconds": 1.84,
+                "partial": False,
+                "stop_reason": None,
+                "directories": [
+                    {
+                        "path": "/var/lib",
+                        "depth": 1,
+                        "size_bytes": 10737418240,
+                        "file_count": 40211
+                    }
+                ]
+            }
+        }
+    )
+
+    root: str = Field(..., description="Scanned root directory")
+    total_bytes: int = Field(..., description="Disk usage of the scanned tree in bytes")
+    file_count: int = Field(..., description="Number of files counted")
+    dir_count: int = Field(..., description="Number of directories scanned")
+    entries_scanned: int = Field(..., description="Number of directory entries examined")
+    error_count: int = Field(0, description="Number of entries that could not be read")
+    elapsed_seconds: float = Field(..., description="Wall-clock scan time in seconds")
+    partial: bool = Field(False, description="Whether the scan stopped early on a budget")
+    stop_reason: Optional[str] = Field(None, description="Budget that stopped the scan, if any")
+    directories: List[DirectoryUsage] = Field(
+        default_factory=list,
+        description="Largest directories per depth, ordered by depth then size"
+    )
+
+
+class PortConnections(BaseModel):
+    """Connection count for a local port."""
+
+    port: int = Field(..., description="Local port number")
+    count: int = Field(..., description="Number of sockets bound to the port")
+
+
+class RemoteHostConnections(BaseModel):
+    """Connection count for a remote host."""
+
+    host: str = Field(..., description="Remote IP address")
+    count: int = Field(..., description="Number of sockets connected to the host")
+
+
+class ConnectionSummary(BaseModel):
+    """Aggregated network connection summary model."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "available": True,
+                "total": 1523,
+                "by_protocol": {"tcp": 1200, "tcp6": 300, "udp": 20, "udp6": 3},
+                "by_state": {"ESTABLISHED": 1100, "TIME_WAIT": 380, "LISTEN": 20},
+                "top_local_ports": [{"port": 443, "count": 1020}],
+                "top_remote_hosts": [{"host": "10.0.0.12", "count": 310}]
+            }
+        }
+    )
+
+    available: bool = Field(..., description="Whether connection information is available on this platform")
+    total: int = Field(..., description="Total number of sockets")
+    by_protocol: Dict[str, int] = Field(default_factory=dict, description="Socket count per protocol")
+    by_state: Dict[str, int] = Field(default_factory=dict, description="TCP socket count per state")
+    top_local_ports: List[PortConnections] = Field(
+        default_factory=list, description="Local ports with the most sockets"
+    )
+    top_remote_hosts: List[RemoteHostConnections] = Field(
+        default_factory=list, description="Remote hosts with the most connected sockets"
+    )
+
+
+class FleetHostResult(BaseModel):
+    """Result of a tool call on one DeviceMCP endpoint in a fleet."""
+
+    endpoint: str = Field(..., description="DeviceMCP endpoint (URL or server script)")
+    ok: bool = Field(..., description="Whether the call succeeded within its deadline")
+    elapsed_seconds: float = Field(..., description="Time spent on the call in seconds")
+    data: Optional[Any] = Field(None, description="Tool result when the call succeeded")
+    error: Optional[str] = Field(None, description="Error message when the call failed")
+
+
+class ProfiledFunction(BaseModel):
+    """Hot function entry of a tool profile."""
+
+    function: str = Field(..., description="Function name")
+    file: str = Field(..., description="Source file")
+    line: int = Field(..., description="Line number of the function definition")
+    calls: int = Field(..., description="Number of calls")
+    total_seconds: float = Field(..., description="Time spent in the function itself")
+    cumulative_seconds: float = Field(..., description="Time spent in the function and its callees")
+
+
+class AllocationSite(BaseModel):
+    """Allocation site entry of a tool profile."""
+
+    file: str = Field(..., description="Source file")
+    line: int = Field(..., description="Line number")
+    size_bytes: int = Field(..., description="Net bytes allocated at this line")
+    count: int = Field(..., description="Net number of blocks allocated at this line")
+
+
+class ProfileReport(BaseModel):
+    """Aggregated profile of a tool's calls."""
+
+    tool: str = Field(..., description="Profiled tool name")
+    calls_profiled: int = Field(..., description="Number of calls profiled so far")
+    calls_remaining: int = Field(..., description="Number of upcoming calls still to be profiled")
+    total_seconds: float = Field(..., description="Wall-clock time of the profiled calls")
+    hot_functions: List[ProfiledFunction] = Field(
+        default_factory=list, description="Functions with the highest cumulative time"
+    )
+    allocation_sites: List[AllocationSite] = Field(
+        default_factory=list, description="Lines that allocated the most memory"
+    )
+
+
+class MetricSamplingRate(BaseModel):
+    """Effective sampling rate of one metric."""
+
+    metric: str = Field(..., description="Metric name (memory, storage, battery)")
+    interval_seconds: float = Field(..., description="Current effective sampling interval in seconds")
+    min_interval_seconds: float = Field(..., description="Sampling interval floor in seconds")
+    max_interval_seconds: float = Field(..., description="Sampling interval ceiling in seconds")
+    samples_per_minute: float = Field(..., description="Effective sampling rate")
+    sample_count: int = Field(..., description="Number of samples taken")
+    last_value: Optional[float] = Field(None, description="Last observed value used for adaptation")
+
+
+class SamplingReport(BaseModel):
+    """Adaptive sampler state model."""
+
+    running: bool = Field(..., description="Whether background sampling is running")
+    on_battery: bool = Field(..., description="Whether the device is running on battery power")
+    metrics: List[MetricSamplingRate] = Field(default_factory=list, description="Per-metric sampling rates")
+
+
+class TemperatureSensor(BaseModel):
+    """Temperature sensor reading model."""
+
+    chip: str = Field(..., description="Sensor chip or driver name (e.g. coretemp)")
+    label: str = Field(..., description="Sensor label (e.g. Package id 0)")
+    current_celsius: float = Field(..., description="Current temperature in degrees Celsius")
+    high_celsius: Optional[float] = Field(None, description="High temperature threshold in degrees Celsius")
+    critical_celsius: Optional[float] = Field(None, description="Critical temperature threshold in degrees Celsius")
+
+
+class FanSensor(BaseModel):
+    """Fan sensor reading model."""
+
+    chip: str = Field(..., description="Sensor chip or driver name")
+    label: str = Field(..., description="Fan label")
+    rpm: int = Field(..., description="Current fan speed in RPM")
+
+
+class ThermalInfo(BaseModel):
+    """Thermal and fan information model."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "has_sensors": True,
+                "temperatures": [
+                    {
+                        "chip": "coretemp",
+                        "label": "Package id 0",
+                        "current_celsius": 54.0,
+                        "high_celsius": 84.0,
+                        "critical_celsius": 100.0
+                    }
+                ],
+                "fans": [
+                    {
+                        "chip": "thinkpad",
+                        "label": "fan1",
+                        "rpm": 2100
+                    }
+                ]
+            }
+        }
+    )
+
+    has_sensors: bool = Field(..., description="Whether any temperature or fan sensor is available")
+    temperatures: List[TemperatureSensor] = Field(default_factory=list, description="Temperature sensor readings")
+    fans: List[FanSensor] = Field(default_factory=list, description="Fan sensor readings")
+
+
+class DeviceCapabilities(BaseModel):
+    """Capabilities probed once per provider model."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "capabilities": {
+                    "battery": False,
+                    "numa": True,
+                    "hwmon": True,
+                    "thermal_zones": True,
+                    "proc_net": True
+                },
+                "probed_at": 1760000000.0
+            }
+        }
+    )
+
+    capabilities: Dict[str, bool] = Field(
+        default_factory=dict,
+        description="Whether each optional binary, sensor or system path is available"
+    )
+    probed_at: float = Field(..., description="Unix timestamp of the last probe")
+
+
+class CgroupUsage(BaseModel):
+    """Resource usage of one cgroup model."""
+
+    path: str = Field(..., description="cgroup path relative to the cgroup root")
+    depth: int = Field(..., description="Depth below the cgroup root (1 = top-level slice)")
+    is_leaf: bool = Field(..., description="Whether the cgroup has no child cgroups")
+    memory_bytes: int = Field(..., description="Current memory usage in bytes")
+    memory_limit_bytes: Optional[int] = Field(None, description="Memory limit in bytes (None if unlimited)")
+    cpu_usage_usec: int = Field(..., description="Total CPU time used in microseconds")
+    cpu_percent: Optional[float] = Field(
+        None, description="CPU usage since the previous call, in percent of one CPU (None on first sight)"
+    )
+    io_read_bytes: int = Field(..., description="Total bytes read from block devices")
+    io_write_bytes: int = Field(..., description="Total bytes written to block devices")
+
+
+class ContainerUsage(BaseModel):
+    """Per-cgroup resource inventory model."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "cgroup_v2": True,
+                "cgroup_count": 412,
+                "sort_by": "memory",
+                "cgroups": [
+                    {
+                        "path": "/system.slice/docker-3f2a.scope",
+                        "depth": 2,
+                        "is_leaf": True,
+                        "memory_bytes": 2147483648,
+                        "memory_limit_bytes": 4294967296,
+                        "cpu_usage_usec": 981234567,
+                        "cpu_percent": 37.5,
+                        "io_read_bytes": 104857600,
+                        "io_write_bytes": 52428800
+                    }
+                ]
+            }
+        }
+    )
+
+    cgroup_v2: bool = Field(..., description="Whether a cgroup v2 hierarchy is available")
+    cgroup_count: int = Field(..., description="Number of cgroups found in the hierarchy")
+    sort_by: str = Field(..., description="Field the cgroups are ranked by (memory, cpu or io)")
+    cgroups: List[CgroupUsage] = Field(default_factory=list, description="Top cgroups by the sort field")
@@ -0,0 +1,366 @@
+"""DeviceMCP Fleet - aggregate device information across many DeviceMCP servers."""
+import argparse
+import asyncio
+import os
+import time
+from typing import List, Dict, Any, Optional
+
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+
+from core.models import FleetHostResult
+
+# Comma-separated endpoints used when the fleet server is started without --endpoint
+FLEET_ENDPOINTS_ENV = "DEVICEMCP_FLEET_ENDPOINTS"
+
+
+class FleetAggregator:
+    """
+    Fan tool calls out to many DeviceMCP endpoints and merge the results.
+
+    Connections are opened on first use and kept in a pool, so repeated queries
+    do not pay the connection handshake again. A connection that fails or misses
+    its deadline is dropped and reopened on the next query; errors reported by
+    the tool itself keep the connection.
+    """
+
+    def __init__(
+        self,
+        endpoints: List[str],
+        deadline: float = 10.0,
+        max_concurrency: int = 64
+    ):
+        """
+        Args:
+            endpoints: DeviceMCP endpoints (HTTP URLs or server script paths)
+            deadline: Per-host deadline in seconds, including connecting
+            max_concurrency: Maximum number of hosts queried at once
+        """
+        self.endpoints = list(dict.fromkeys(endpoints))
+        self.deadline = deadline
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._clients: Dict[str, Client] = {}
+        # Serializes connecting per endpoint so concurrent queries share one client
+        self._connect_locks: Dict[str, asyncio.Lock] = {}
+        # Calls in flight per client (by id), so a dropped connection is only
+        # closed once no other query is still using it
+        self._in_flight: Dict[int, int] = {}
+        self._dropped: Dict[int, Client] = {}
+
+    async def __aenter__(self) -> "FleetAggregator":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        clients, self._clients = self._clients, {}
+        await asyncio.gather(
+            *(self._close_client(client) for client in clients.values()),
+            return_exceptions=True
+        )
+
+    async def _close_client(self, client: Client) -> None:
+        """Close one pooled connection, ignoring errors from broken sessions."""
+        try:
+            await client.__aexit__(None, None, None)
+        except Exception:
+            pass
+
+    async def _drop(self, endpoint: str, client: Client) -> None:
+        """Remove a client from the pool, closing it once no query is using it."""
+        if self._clients.get(endpoint) is client:
+            del self._clients[endpoint]
+        if self._in_flight.get(id(client)):
+            self._dropped[id(client)] = client
+        else:
+            await self._close_client(client)
+
+    async def _get_client(self, endpoint: str) -> Client:
+        """Return a connected client for the endpoint, connecting if needed."""
+        client = self._clients.get(endpoint)
+        if client is not None and client.is_connected():
+            return client
+
+        lock = self._connect_locks.setdefault(endpoint, asyncio.Lock())
+        async with lock:
+            # Another query may have connected while this one waited
+            client = self._clients.get(endpoint)
+            if client is not None and client.is_connected():
+                return client
+            if client is not None:
+                # Broken connection left in the pool
+                await self._drop(endpoint, client)
+
+            client = Client(endpoint)
+            self._clients[endpoint] = client
+            try:
+                await client.__aenter__()
+            except BaseException:
+                # Failed or cut off by the deadline
+                self._clients.pop(endpoint, None)
+                await self._close_client(client)
+                raise
+            return client
+
+    async def _call_host(self, endpoint: str, tool: str, arguments: Dict[str, Any]) -> Any:
+        client = await self._get_client(endpoint)
+        key = id(client)
+        self._in_flight[key] = self._in_flight.get(key, 0) + 1
+        try:
+            result = await client.call_tool(tool, arguments)
+        except ToolError:
+            # The host answered; the connection is fine
+            raise
+        except BaseException:
+            # Transport error or deadline; reconnect on the next query
+            await self._drop(endpoint, client)
+            raise
+        finally:
+            self._in_flight[key] -= 1
+            if self._in_flight[key] == 0:
+                del self._in_flight[key]
+                dropped = self._dropped.pop(key, None)
+                if dropped is not None:
+                    await self._close_client(dropped)
+        # Use plain JSON rather than the client's typed objects; non-object
+        # results (e.g. get_storage_info's list) are wrapped as {"result": ...}
+        data = result.structured_content
+        if isinstance(data, dict) and list(data) == ["result"]:
+            data = data["result"]
+        return data
+
+    async def _query_host(
+        self,
+        endpoint: str,
+        tool: str,
+        arguments: Dict[str, Any],
+        deadline: float
+    ) -> FleetHostResult:
+        async with self._semaphore:
+            start = time.monotonic()
+            try:
+                data = await asyncio.wait_for(
+                    self._call_host(endpoint, tool, arguments), timeout=deadline
+                )
+            except Exception as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    error = f"Deadline of {deadline}s exceeded"
+                else:
+                    error = str(e) or type(e).__name__
+                return FleetHostResult(
+                    endpoint=endpoint,
+                    ok=False,
+                    elapsed_seconds=round(time.monotonic() - start, 3),
+                    error=error
+                )
+
+            return FleetHostResult(
+                endpoint=endpoint,
+                ok=True,
+                elapsed_seconds=round(time.monotonic() - start, 3),
+                data=data
+            )
+
+    async def query(
+        self,
+        tool: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None
+    ) -> List[FleetHostResult]:
+        """
+        Call a tool on every endpoint concurrently.
+
+        Args:
+            tool: Tool name, e.g. "get_system_summary"
+            arguments: Tool arguments
+            deadline: Per-host deadline in seconds (uses the aggregator default if None)
+
+        Returns:
+            List[FleetHostResult]: One result per endpoint, in endpoint order
+        """
+        deadline = self.deadline if deadline is None else deadline
+        return await asyncio.gather(*(
+            self._query_host(endpoint, tool, arguments or {}, deadline)
+            for endpoint in self.endpoints
+        ))
+
+    async def top_storage_usage(
+        self,
+        limit: int = 10,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the hosts with the fullest mount points.
+
+        Args:
+            limit: Number of hosts to return
+            deadline: Per-host deadline in seconds
+
+        Returns:
+            dict: "hosts" ordered by their highest usage_percent, plus "failed" hosts
+        """
+        results = await self.query("get_storage_info", deadline=deadline)
+        hosts = []
+        for result in results:
+            if not result.ok or not result.data:
+                continue
+            fullest = max(result.data, key=lambda storage: storage["usage_percent"])
+            hosts.append({
+                "endpoint": result.endpoint,
+                "mount_point": fullest["mount_point"],
+                "usage_percent": fullest["usage_percent"],
+                "free_bytes": fullest["free_bytes"]
+            })
+
+        hosts.sort(key=lambda host: host["usage_percent"], reverse=True)
+        return {"hosts": hosts[:limit], "failed": _failed(results)}
+
+    async def low_battery(
+        self,
+        threshold: float = 20.0,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the hosts running on a battery below the threshold.
+
+        Args:
+            threshold: Battery percentage below which a host is reported
+            deadline: Per-host deadline in seconds
+
+        Returns:
+            dict: "hosts" ordered by battery percentage, plus "failed" hosts
+        """
+        results = await self.query("get_battery_level", deadline=deadline)
+        hosts = []
+        for result in results:
+            if not result.ok:
+                continue
+            battery = result.data
+            if not battery.get("has_battery") or battery.get("percentage") is None:
+                continue
+            if battery["percentage"] < threshold:
+                hosts.append({
+                    "endpoint": result.endpoint,
+                    "percentage": battery["percentage"],
+                    "is_plugged": battery.get("is_plugged")
+                })
+
+        hosts.sort(key=lambda host: host["percentage"])
+        return {"hosts": hosts, "failed": _failed(results)}
+
+
+def _failed(results: List[FleetHostResult]) -> List[Dict[str, Any]]:
+    """Summarize the hosts that did not answer."""
+    return [
+        {"endpoint": result.endpoint, "error": result.error}
+        for result in results if not result.ok
+    ]
+
+
+# Initialize FastMCP fleet server
+mcp = FastMCP("DeviceMCP Fleet")
+
+_aggregator: Optional[FleetAggregator] = None
+
+
+def configure(endpoints: List[str], deadline: float = 10.0) -> FleetAggregator:
+    """
+    Set the endpoints served by the fleet tools.
+
+    Args:
+        endpoints: DeviceMCP endpoints (HTTP URLs or server script paths)
+        deadline: Default per-host deadline in seconds
+
+    Returns:
+        FleetAggregator: The aggregator used by the fleet tools
+    """
+    global _aggregator
+    _aggregator = FleetAggregator(endpoints, deadline=deadline)
+    return _aggregator
+
+
+def _get_aggregator() -> FleetAggregator:
+    if _aggregator is None:
+        endpoints = [e.strip() for e in os.environ.get(FLEET_ENDPOINTS_ENV, "").split(",")]
+        configure([e for e in endpoints if e])
+    return _aggregator
+
+
+@mcp.tool()
+async def fleet_system_summary(deadline: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    Get the system summary of every host in the fleet.
+
+    Args:
+        deadline: Per-host deadline in seconds (server default if not given)
+
+    Returns a list with one entry per host containing:
+    - endpoint: DeviceMCP endpoint
+    - ok: Whether the host answered within its deadline
+    - elapsed_seconds: Time spent on the host
+    - data: The host's get_system_summary result (if ok)
+    - error: Error message (if not ok)
+    """
+    results = await _get_aggregator().query("get_system_summary", deadline=deadline)
+    return [result.model_dump() for result in results]
+
+
+@mcp.tool()
+async def fleet_top_storage_usage(limit: int = 10, deadline: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Get the hosts with the fullest disks.
+
+    Args:
+        limit: Number of hosts to return
+        deadline: Per-host deadline in seconds (server default if not given)
+
+    Returns a dictionary containing:
+    - hosts: Hosts ordered by their fullest mount point (endpoint, mount_point,
+      usage_percent, free_bytes)
+    - failed: Hosts that did not answer (endpoint, error)
+    """
+    return await _get_aggregator().top_storage_usage(limit=limit, deadline=deadline)
+
+
+@mcp.tool()
+async def fleet_low_battery(threshold: float = 20.0, deadline: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Get the hosts whose battery is below a threshold.
+
+    Args:
+        threshold: Battery percentage below which a host is reported
+        deadline: Per-host deadline in seconds (server default if not given)
+
+    Returns a dictionary containing:
+    - hosts: Hosts ordered by battery percentage (endpoint, percentage, is_plugged)
+    - failed: Hosts that did not answer (endpoint, error)
+    """
+    return await _get_aggregator().low_battery(threshold=threshold, deadline=deadline)
+
+
+def main() -> None:
+    """Run the DeviceMCP fleet server."""
+    parser = argparse.ArgumentParser(description="DeviceMCP fleet aggregator")
+    parser.add_argument("--endpoint", action="append", default=[],
+                        help=f"DeviceMCP endpoint, repeatable (default: ${FLEET_ENDPOINTS_ENV})")
+    parser.add_argument("--deadline", type=float, default=10.0,
+                        help="Per-host deadline in seconds (default: 10)")
+    parser.add_argument("--transport", choices=["stdio", "http"], default="stdio",
+                        help="Transport to serve on (default: stdio)")
+    parser.add_argument("--host", default="127.0.0.1", help="HTTP host to bind")
+    parser.add_argument("--port", type=int, default=8001, help="HTTP port to bind")
+    args = parser.parse_args()
+
+    if args.endpoint:
+        configure(args.endpoint, deadline=args.deadline)
+
+    if args.transport == "http":
+        mcp.run(transport="http", host=args.host, port=args.port)
+    else:
+        mcp.run()
+
+
+if __name__ == "__main__":
+    main()
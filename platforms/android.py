@@ -1,10 +1,17 @@
 """Android platform implementation (via Termux)."""
 import platform
 import psutil
+import shutil
 import subprocess
-from typing import List, Optional
+from typing import Dict, List, Optional
 from core.base import DeviceInfoProvider
-from core.models import DeviceInfo, BatteryInfo, StorageInfo, MemoryInfo
+from core.models import (
+    DeviceInfo,
+    BatteryInfo,
+    StorageInfo,
+    MemoryInfo,
+    ThermalInfo
+)
 
 
 class AndroidDeviceProvider(DeviceInfoProvider):
@@ -23,21 +30,33 @@ class AndroidDeviceProvider(DeviceInfoProvider):
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return None
 
+    def _probe_capabilities(self) -> Dict[str, bool]:
+        """Probe Android capabilities."""
+        return {
+            "termux_api": shutil.which("termux-battery-status") is not None,
+            "getprop": shutil.which("getprop") is not None,
+            "battery": psutil.sensors_battery() is not None,
+            # psutil only exposes sensors on some platforms
+            "sensors_temperatures": hasattr(psutil, 'sensors_temperatures'),
+            "sensors_fans": hasattr(psutil, 'sensors_fans')
+        }
+
     def get_device_info(self) -> DeviceInfo:
         """Get Android device information."""
         # Try to get Android version via getprop
         android_version = "Unknown"
-        try:
-            result = subprocess.run(
-                ["getprop", "ro.build.version.release"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                android_version = result.stdout.strip()
-        except:
-            pass
+        if self.has_capability('getprop'):
+            try:
+                result = subprocess.run(
+                    ["getprop", "ro.build.version.release"],
+                    capture_output=True,
+                    text=True,
+                    timeout=5
+                )
+                if result.returncode == 0:
+                    android_version = result.stdout.strip()
+            except:
+                pass
 
         return DeviceInfo(
             os_name="Android",
@@ -50,8 +69,10 @@ class AndroidDeviceProvider(DeviceInfoProvider):
 
     def get_battery_level(self) -> BatteryInfo:
         """Get Android battery information using termux-battery-status."""
-        # Try to use termux-battery-status if available
-        battery_json = self._run_termux_command("termux-battery-status")
+        # Try to use termux-battery-status if termux-api was found at probe time
+        battery_json = None
+        if self.has_capability('termux_api'):
+            battery_json = self._run_termux_command("termux-battery-status")
 
         if battery_json:
             try:
@@ -68,7 +89,7 @@ class AndroidDeviceProvider(DeviceInfoProvider):
                 pass
 
         # Fallback to psutil
-        battery = psutil.sensors_battery()
+        battery = psutil.sensors_battery() if self.has_capability('battery') else None
         if battery is None:
             return BatteryInfo(
                 percentage=None,
@@ -124,4 +145,11 @@ class AndroidDeviceProvider(DeviceInfoProvider):
             usage_percent=mem.percent,
             swap_total_bytes=swap.total if swap.total > 0 else None,
             swap_used_bytes=swap.used if swap.total > 0 else None
-        )
\ No newline at end of file
+        )
+
+    def get_thermal_info(self) -> ThermalInfo:
+        """Get Android temperature and fan information."""
+        return self._get_psutil_thermal_info(
+            temperatures=self.has_capability('sensors_temperatures'),
+            fans=self.has_capability('sensors_fans')
+        )
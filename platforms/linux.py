@@ -1,14 +1,367 @@
 """Linux platform implementation."""
+import heapq
+import os
 import platform
+import re
+import socket
+import time
 import psutil
-from typing import List
+from collections import Counter
+from typing import List, Dict, Iterable, Optional, Tuple
 from core.base import DeviceInfoProvider
-from core.models import DeviceInfo, BatteryInfo, StorageInfo, MemoryInfo
+from core.models import (
+    DeviceInfo,
+    BatteryInfo,
+    StorageInfo,
+    MemoryInfo,
+    HugePagePool,
+    NumaNodeInfo,
+    MemoryTopology,
+    PortConnections,
+    RemoteHostConnections,
+    ConnectionSummary,
+    TemperatureSensor,
+    FanSensor,
+    ThermalInfo,
+    DeviceCapabilities,
+    CgroupUsage,
+    ContainerUsage
+)
 import distro
 
+# TCP states as encoded in the "st" column of /proc/net/tcp{,6}
+_TCP_STATES = {
+    '01': 'ESTABLISHED',
+    '02': 'SYN_SENT',
+    '03': 'SYN_RECV',
+    '04': 'FIN_WAIT1',
+    '05': 'FIN_WAIT2',
+    '06': 'TIME_WAIT',
+    '07': 'CLOSE',
+    '08': 'CLOSE_WAIT',
+    '09': 'LAST_ACK',
+    '0A': 'LISTEN',
+    '0B': 'CLOSING',
+    '0C': 'NEW_SYN_RECV',
+}
+
+_PROC_NET_PROTOCOLS = ('tcp', 'tcp6', 'udp', 'udp6')
+
+_HWMON_INPUT = re.compile(r'^(temp|fan)(\d+)_input$')
+
+# Ranking key per get_container_usage sort_by, over the rows built while walking:
+# (path, depth, is_leaf, memory, cpu_usage_usec, cpu_percent, io_read, io_write)
+_CGROUP_SORT_KEYS = {
+    'memory': lambda row: row[3],
+    # cgroups without a CPU baseline yet rank last
+    'cpu': lambda row: -1.0 if row[5] is None else row[5],
+    'io': lambda row: row[6] + row[7],
+}
+
+
+def _parse_cpulist(cpulist: str) -> List[int]:
+    """Expand a sysfs CPU list such as "0-3,8-11" into CPU ids."""
+    cpus = []
+    for part in cpulist.strip().split(','):
+        if not part:
+            continue
+        if '-' in part:
+            start, end = part.split('-', 1)
+            cpus.extend(range(int(start), int(end) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def _read_node_meminfo(path: str) -> Dict[str, int]:
+    """Parse a per-node meminfo file into a dict of byte (or page) counts."""
+    values = {}
+    with open(path, 'r') as f:
+        for line in f:
+            # Lines look like "Node 0 MemTotal:       4423416 kB"
+            fields = line.split()
+            if len(fields) < 4:
+                continue
+            value = int(fields[3])
+            if len(fields) > 4 and fields[4] == 'kB':
+                value *= 1024
+            values[fields[2].rstrip(':')] = value
+    return values
+
+
+def _read_int(path: str, default: int = 0) -> int:
+    """Read a single integer from a sysfs file."""
+    try:
+        with open(path, 'r') as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return default
+
+
+def _read_text(path: str) -> Optional[str]:
+    """Read a small sysfs text file, or None if it cannot be read."""
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _read_millidegrees(path: str) -> Optional[float]:
+    """Read a hwmon millidegree Celsius file as degrees Celsius."""
+    value = _read_text(path)
+    try:
+        return int(value) / 1000.0 if value is not None else None
+    except ValueError:
+        return None
+
+
+def _read_sensor_input(path: str) -> Optional[int]:
+    """
+    Read a hwmon *_input file.
+
+    Returns:
+        Optional[int]: The raw reading, or None on a transient read error
+        (some sensors routinely fail with EIO or ENODATA)
+
+    Raises:
+        FileNotFoundError: If the sensor no longer exists
+    """
+    try:
+        with open(path, 'r') as f:
+            return int(f.read().strip())
+    except FileNotFoundError:
+        raise
+    except (OSError, ValueError):
+        return None
+
+
+def _discover_hwmon(root: str):
+    """
+    Find hwmon temperature and fan inputs.
+
+    Thresholds and labels are read once here; only the input files need to be
+    re-read to refresh the readings.
+
+    Returns:
+        tuple: (temperatures, fans) where temperatures are
+        (chip, label, input_path, high, critical) and fans are (chip, label, input_path)
+    """
+    temperatures = []
+    fans = []
+    try:
+        devices = sorted(os.listdir(root))
+    except OSError:
+        return temperatures, fans
+
+    for device in devices:
+        device_path = os.path.join(root, device)
+        chip = _read_text(os.path.join(device_path, 'name')) or device
+        try:
+            names = sorted(os.listdir(device_path))
+        except OSError:
+            continue
+
+        for name in names:
+            match = _HWMON_INPUT.match(name)
+            if match is None:
+                continue
+            kind, index = match.groups()
+            prefix = os.path.join(device_path, f"{kind}{index}")
+            label = _read_text(f"{prefix}_label") or f"{kind}{index}"
+            if kind == 'temp':
+                temperatures.append((
+                    chip,
+                    label,
+                    f"{prefix}_input",
+                    _read_millidegrees(f"{prefix}_max"),
+                    _read_millidegrees(f"{prefix}_crit")
+                ))
+            else:
+                fans.append((chip, label, f"{prefix}_input"))
+
+    return temperatures, fans
+
+
+def _walk_cgroups(root: str) -> Iterable[Tuple[str, int, bool]]:
+    """
+    Walk the cgroups below a cgroup v2 root, without the root itself.
+
+    Yields:
+        tuple: (path, depth, is_leaf) where depth 1 is a direct child of the root
+    """
+    stack = [(root, 0)]
+    while stack:
+        path, depth = stack.pop()
+        children = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    # Only cgroups are directories; interface files are skipped
+                    # without a stat call
+                    if entry.is_dir(follow_symlinks=False):
+                        children.append(entry.path)
+        except OSError:
+            # The cgroup was removed while walking
+            continue
+        stack.extend((child, depth + 1) for child in children)
+        if depth > 0:
+            yield path, depth, not children
+
+
+def _read_cpu_usage_usec(path: str) -> int:
+    """Read usage_usec from a cgroup cpu.stat file."""
+    try:
+        with open(path, 'r') as f:
+            for line in f:
+                if line.startswith('usage_usec '):
+                    return int(line[11:])
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def _read_io_bytes(path: str) -> Tuple[int, int]:
+    """Sum rbytes and wbytes over all devices of a cgroup io.stat file."""
+    read_bytes = 0
+    write_bytes = 0
+    try:
+        with open(path, 'r') as f:
+            for line in f:
+                # "8:0 rbytes=1 wbytes=2 rios=3 wios=4 dbytes=0 dios=0"
+                for field in line.split()[1:]:
+                    key, _, value = field.partition('=')
+                    if key == 'rbytes':
+                        read_bytes += int(value)
+                    elif key == 'wbytes':
+                        write_bytes += int(value)
+    except (OSError, ValueError):
+        pass
+    return read_bytes, write_bytes
+
+
+def _decode_proc_net_address(hex_address: str) -> str:
+    """Convert a /proc/net hex address (host byte order words) to an IP string."""
+    raw = bytes.fromhex(hex_address)
+    if len(raw) == 4:
+        return socket.inet_ntop(socket.AF_INET, raw[::-1])
+    # IPv6 addresses are four 32-bit words, each in host byte order
+    words = b''.join(raw[i:i + 4][::-1] for i in range(0, 16, 4))
+    return socket.inet_ntop(socket.AF_INET6, words)
+
+
+def _summarize_proc_net(
+    tables: Iterable[Tuple[str, Iterable[str]]],
+    top_n: int = 10
+) -> ConnectionSummary:
+    """
+    Aggregate /proc/net socket tables without building per-socket objects.
+
+    Counting is done on the raw hex fields; only the distinct ports and hosts
+    that make it into the result are decoded.
+
+    Args:
+        tables: (protocol, lines) pairs, e.g. ("tcp", open("/proc/net/tcp"))
+        top_n: Number of local ports and remote hosts to report
+
+    Returns:
+        ConnectionSummary: Aggregated connection counts
+    """
+    by_protocol = Counter()
+    states = Counter()
+    local_ports = Counter()
+    remote_hosts = Counter()
+
+    for protocol, lines in tables:
+        is_tcp = protocol.startswith('tcp')
+        count = 0
+        lines = iter(lines)
+        next(lines, None)  # Header
+        for line in lines:
+            # "sl local_address rem_address st ..."; the tail is left unsplit
+            fields = line.split(None, 4)
+            if len(fields) < 4:
+                continue
+            count += 1
+            local, remote, state = fields[1], fields[2], fields[3]
+            local_ports[local[-4:]] += 1
+            if is_tcp:
+                states[state] += 1
+            remote_host = remote[:-5]
+            if remote_host.strip('0'):
+                remote_hosts[remote_host] += 1
+        by_protocol[protocol] += count
+
+    return ConnectionSummary(
+        available=True,
+        total=sum(by_protocol.values()),
+        by_protocol=dict(by_protocol),
+        by_state={_TCP_STATES.get(state, state): n for state, n in states.most_common()},
+        top_local_ports=[
+            PortConnections(port=int(port, 16), count=n)
+            for port, n in local_ports.most_common(top_n)
+        ],
+        top_remote_hosts=[
+            RemoteHostConnections(host=_decode_proc_net_address(host), count=n)
+            for host, n in remote_hosts.most_common(top_n)
+        ]
+    )
+
+
 class LinuxDeviceProvider(DeviceInfoProvider):
     """Device information provider for Linux."""
 
+    NUMA_NODE_PATH = "/sys/devices/system/node"
+    PROC_NET_PATH = "/proc/net"
+    HWMON_PATH = "/sys/class/hwmon"
+    THERMAL_PATH = "/sys/class/thermal"
+    POWER_SUPPLY_PATH = "/sys/class/power_supply"
+    CGROUP_PATH = "/sys/fs/cgroup"
+
+    def __init__(self):
+        # hwmon sensors found on first use of get_thermal_info
+        self._hwmon_sensors = None
+        # cgroup path -> (usage_usec, monotonic time) from the previous
+        # get_container_usage call, used to turn CPU time into a rate
+        self._cgroup_cpu_baselines: Dict[str, Tuple[int, float]] = {}
+        super().__init__()
+
+    def probe_capabilities(self) -> DeviceCapabilities:
+        """Probe Linux capabilities, forgetting previously discovered sensors."""
+        self._hwmon_sensors = None
+        return super().probe_capabilities()
+
+    def _probe_capabilities(self) -> Dict[str, bool]:
+        """Probe Linux capabilities."""
+        try:
+            thermal_zones = any(
+                name.startswith('thermal_zone') for name in os.listdir(self.THERMAL_PATH)
+            )
+        except OSError:
+            thermal_zones = False
+
+        return {
+            "battery": self._probe_battery(),
+            "numa": os.path.isdir(self.NUMA_NODE_PATH),
+            "hwmon": os.path.isdir(self.HWMON_PATH),
+            "thermal_zones": thermal_zones,
+            "proc_net": os.path.isdir(self.PROC_NET_PATH),
+            "cgroup_v2": os.path.isfile(os.path.join(self.CGROUP_PATH, 'cgroup.controllers'))
+        }
+
+    def _probe_battery(self) -> bool:
+        """Check for a battery among the power supplies."""
+        try:
+            supplies = os.listdir(self.POWER_SUPPLY_PATH)
+        except OSError:
+            # No power_supply class (e.g. some containers); ask psutil once
+            return psutil.sensors_battery() is not None
+
+        return any(
+            _read_text(os.path.join(self.POWER_SUPPLY_PATH, name, 'type')) == 'Battery'
+            for name in supplies
+        )
+
     def get_device_info(self) -> DeviceInfo:
         """Get Linux device information."""
         # Try to get more specific Linux distribution info
@@ -31,7 +384,8 @@ class LinuxDeviceProvider(DeviceInfoProvider):
 
     def get_battery_level(self) -> BatteryInfo:
         """Get Linux battery information."""
-        battery = psutil.sensors_battery()
+        # Desktops and servers without a battery skip the probe entirely
+        battery = psutil.sensors_battery() if self.has_capability('battery') else None
 
         if battery is None:
             return BatteryInfo(
@@ -88,4 +442,231 @@ class LinuxDeviceProvider(DeviceInfoProvider):
             usage_percent=mem.percent,
             swap_total_bytes=swap.total,
             swap_used_bytes=swap.used
-        )
\ No newline at end of file
+        )
+
+    def get_memory_topology(self) -> MemoryTopology:
+        """Get Linux per-NUMA-node memory topology from sysfs."""
+        if not self.has_capability('numa'):
+            return MemoryTopology(numa_available=False, node_count=0, nodes=[])
+
+        try:
+            entries = os.listdir(self.NUMA_NODE_PATH)
+        except OSError:
+            return MemoryTopology(numa_available=False, node_count=0, nodes=[])
+
+        node_ids = sorted(
+            int(name[4:]) for name in entries
+            if name.startswith('node') and name[4:].isdigit()
+        )
+
+        nodes = []
+        for node_id in node_ids:
+            node_path = os.path.join(self.NUMA_NODE_PATH, f"node{node_id}")
+            try:
+                meminfo = _read_node_meminfo(os.path.join(node_path, 'meminfo'))
+            except OSError:
+                continue
+
+            total = meminfo.get('MemTotal', 0)
+            free = meminfo.get('MemFree', 0)
+            used = meminfo.get('MemUsed', total - free)
+
+            try:
+                with open(os.path.join(node_path, 'cpulist'), 'r') as f:
+                    cpus = _parse_cpulist(f.read())
+            except OSError:
+                cpus = []
+
+            try:
+                with open(os.path.join(node_path, 'distance'), 'r') as f:
+                    distances = [int(d) for d in f.read().split()]
+            except (OSError, ValueError):
+                distances = []
+
+            nodes.append(NumaNodeInfo(
+                node_id=node_id,
+                cpus=cpus,
+                total_bytes=total,
+                free_bytes=free,
+                used_bytes=used,
+                usage_percent=round(used / total * 100, 1) if total else 0.0,
+                hugepages=self._get_node_hugepages(node_path),
+                distances=distances
+            ))
+
+        return MemoryTopology(
+            numa_available=len(nodes) > 0,
+            node_count=len(nodes),
+            nodes=nodes
+        )
+
+    def _get_node_hugepages(self, node_path: str) -> List[HugePagePool]:
+        """Get the hugepage pools of a single NUMA node."""
+        hugepages_path = os.path.join(node_path, 'hugepages')
+        try:
+            pool_names = os.listdir(hugepages_path)
+        except OSError:
+            return []
+
+        pools = []
+        for name in pool_names:
+            # Pool directories are named like "hugepages-2048kB"
+            if not (name.startswith('hugepages-') and name.endswith('kB')):
+                continue
+            try:
+                page_size = int(name[len('hugepages-'):-2]) * 1024
+            except ValueError:
+                continue
+
+            pool_path = os.path.join(hugepages_path, name)
+            pools.append(HugePagePool(
+                page_size_bytes=page_size,
+                total_pages=_read_int(os.path.join(pool_path, 'nr_hugepages')),
+                free_pages=_read_int(os.path.join(pool_path, 'free_hugepages')),
+                surplus_pages=_read_int(os.path.join(pool_path, 'surplus_hugepages'))
+            ))
+
+        pools.sort(key=lambda pool: pool.page_size_bytes)
+        return pools
+
+    def get_connection_summary(self, top_n: int = 10) -> ConnectionSummary:
+        """Get Linux connection counts by streaming /proc/net socket tables."""
+        if not self.has_capability('proc_net'):
+            return ConnectionSummary(available=False, total=0)
+
+        files = []
+        try:
+            for protocol in _PROC_NET_PROTOCOLS:
+                try:
+                    files.append((protocol, open(os.path.join(self.PROC_NET_PATH, protocol), 'r')))
+                except OSError:
+                    # IPv6 tables are absent when IPv6 is disabled
+                    continue
+            return _summarize_proc_net(files, top_n=top_n)
+        finally:
+            for _, f in files:
+                f.close()
+
+    def get_container_usage(
+        self,
+        top_n: int = 10,
+        sort_by: str = "memory",
+        leaf_only: bool = True
+    ) -> ContainerUsage:
+        """
+        Get per-cgroup usage by walking the cgroup v2 hierarchy.
+
+        A parent cgroup's usage includes all of its children, so by default only
+        leaf cgroups (containers and services) are read and ranked. Each costs
+        three small reads (memory.current, cpu.stat, io.stat); models and memory
+        limits are only built for the top_n cgroups reported.
+        """
+        sort_key = _CGROUP_SORT_KEYS.get(sort_by)
+        if sort_key is None:
+            raise ValueError(f"sort_by must be one of {', '.join(_CGROUP_SORT_KEYS)}")
+        if not self.has_capability('cgroup_v2'):
+            return ContainerUsage(cgroup_v2=False, cgroup_count=0, sort_by=sort_by, cgroups=[])
+
+        root = self.CGROUP_PATH
+        previous = self._cgroup_cpu_baselines
+        baselines: Dict[str, Tuple[int, float]] = {}
+        rows = []
+        cgroup_count = 0
+
+        for path, depth, is_leaf in _walk_cgroups(root):
+            cgroup_count += 1
+            if leaf_only and not is_leaf:
+                continue
+            memory = _read_int(os.path.join(path, 'memory.current'))
+            cpu_usage = _read_cpu_usage_usec(os.path.join(path, 'cpu.stat'))
+            now = time.monotonic()
+            io_read, io_write = _read_io_bytes(os.path.join(path, 'io.stat'))
+
+            cpu_percent = None
+            baseline = previous.get(path)
+            if baseline is not None and now > baseline[1] and cpu_usage >= baseline[0]:
+                cpu_percent = (cpu_usage - baseline[0]) / ((now - baseline[1]) * 1e6) * 100
+            baselines[path] = (cpu_usage, now)
+            rows.append((path, depth, is_leaf, memory, cpu_usage, cpu_percent, io_read, io_write))
+
+        # Only cgroups read in this walk are kept, so removed containers are forgotten
+        self._cgroup_cpu_baselines = baselines
+
+        cgroups = []
+        for path, depth, is_leaf, memory, cpu_usage, cpu_percent, io_read, io_write in heapq.nlargest(
+            top_n, rows, key=sort_key
+        ):
+            limit = _read_text(os.path.join(path, 'memory.max'))
+            cgroups.append(CgroupUsage(
+                path='/' + os.path.relpath(path, root),
+                depth=depth,
+                is_leaf=is_leaf,
+                memory_bytes=memory,
+                memory_limit_bytes=int(limit) if limit and limit.isdigit() else None,
+                cpu_usage_usec=cpu_usage,
+                cpu_percent=None if cpu_percent is None else round(cpu_percent, 2),
+                io_read_bytes=io_read,
+                io_write_bytes=io_write
+            ))
+
+        return ContainerUsage(
+            cgroup_v2=True,
+            cgroup_count=cgroup_count,
+            sort_by=sort_by,
+            cgroups=cgroups
+        )
+
+    def get_thermal_info(self) -> ThermalInfo:
+        """Get Linux temperature and fan information from hwmon."""
+        if self._hwmon_sensors is None:
+            if self.has_capability('hwmon'):
+                self._hwmon_sensors = _discover_hwmon(self.HWMON_PATH)
+            else:
+                self._hwmon_sensors = ([], [])
+        temperature_inputs, fan_inputs = self._hwmon_sensors
+
+        if not temperature_inputs and not fan_inputs:
+            if not self.has_capability('thermal_zones'):
+                return ThermalInfo(has_sensors=False, temperatures=[], fans=[])
+            # No hwmon sensors but thermal zones exist; let psutil read them
+            return self._get_psutil_thermal_info()
+
+        temperatures = []
+        fans = []
+        stale = False
+
+        for chip, label, input_path, high, critical in temperature_inputs:
+            try:
+                current = _read_sensor_input(input_path)
+            except FileNotFoundError:
+                stale = True
+                continue
+            if current is None:
+                continue
+            temperatures.append(TemperatureSensor(
+                chip=chip,
+                label=label,
+                current_celsius=current / 1000.0,
+                high_celsius=high,
+                critical_celsius=critical
+            ))
+
+        for chip, label, input_path in fan_inputs:
+            try:
+                rpm = _read_sensor_input(input_path)
+            except FileNotFoundError:
+                stale = True
+                continue
+            if rpm is None:
+                continue
+            fans.append(FanSensor(chip=chip, label=label, rpm=rpm))
+
+        if stale:
+            # A sensor disappeared (e.g. module unloaded); rediscover next call
+            self._hwmon_sensors = None
+
+        return ThermalInfo(
+            has_sensors=bool(temperatures or fans),
+            temperatures=temperatures,
+            fans=fans
+        )
@@ -1,14 +1,29 @@
 """macOS platform implementation."""
 import platform
 import psutil
-from typing import List
+from typing import Dict, List
 from core.base import DeviceInfoProvider
-from core.models import DeviceInfo, BatteryInfo, StorageInfo, MemoryInfo
+from core.models import (
+    DeviceInfo,
+    BatteryInfo,
+    StorageInfo,
+    MemoryInfo,
+    ThermalInfo
+)
 
 
 class MacOSDeviceProvider(DeviceInfoProvider):
     """Device information provider for macOS."""
 
+    def _probe_capabilities(self) -> Dict[str, bool]:
+        """Probe macOS capabilities."""
+        return {
+            "battery": psutil.sensors_battery() is not None,
+            # psutil only exposes sensors on some platforms
+            "sensors_temperatures": hasattr(psutil, 'sensors_temperatures'),
+            "sensors_fans": hasattr(psutil, 'sensors_fans')
+        }
+
     def get_device_info(self) -> DeviceInfo:
         """Get macOS device information."""
         return DeviceInfo(
@@ -22,7 +37,8 @@ class MacOSDeviceProvider(DeviceInfoProvider):
 
     def get_battery_level(self) -> BatteryInfo:
         """Get macOS battery information."""
-        battery = psutil.sensors_battery()
+        # Desktops and servers without a battery skip the probe entirely
+        battery = psutil.sensors_battery() if self.has_capability('battery') else None
 
         if battery is None:
             return BatteryInfo(
@@ -79,4 +95,11 @@ class MacOSDeviceProvider(DeviceInfoProvider):
             usage_percent=mem.percent,
             swap_total_bytes=swap.total,
             swap_used_bytes=swap.used
-        )
\ No newline at end of file
+        )
+
+    def get_thermal_info(self) -> ThermalInfo:
+        """Get macOS temperature and fan information."""
+        return self._get_psutil_thermal_info(
+            temperatures=self.has_capability('sensors_temperatures'),
+            fans=self.has_capability('sensors_fans')
+        )
@@ -1,14 +1,29 @@
 """Windows platform implementation."""
 import platform
 import psutil
-from typing import List
+from typing import Dict, List
 from core.base import DeviceInfoProvider
-from core.models import DeviceInfo, BatteryInfo, StorageInfo, MemoryInfo
+from core.models import (
+    DeviceInfo,
+    BatteryInfo,
+    StorageInfo,
+    MemoryInfo,
+    ThermalInfo
+)
 
 
 class WindowsDeviceProvider(DeviceInfoProvider):
     """Device information provider for Windows."""
 
+    def _probe_capabilities(self) -> Dict[str, bool]:
+        """Probe Windows capabilities."""
+        return {
+            "battery": psutil.sensors_battery() is not None,
+            # psutil only exposes sensors on some platforms
+            "sensors_temperatures": hasattr(psutil, 'sensors_temperatures'),
+            "sensors_fans": hasattr(psutil, 'sensors_fans')
+        }
+
     def get_device_info(self) -> DeviceInfo:
         """Get Windows device information."""
         return DeviceInfo(
@@ -22,7 +37,8 @@ class WindowsDeviceProvider(DeviceInfoProvider):
 
     def get_battery_level(self) -> BatteryInfo:
         """Get Windows battery information."""
-        battery = psutil.sensors_battery()
+        # Desktops and servers without a battery skip the probe entirely
+        battery = psutil.sensors_battery() if self.has_capability('battery') else None
 
         if battery is None:
             return BatteryInfo(
@@ -80,4 +96,11 @@ class WindowsDeviceProvider(DeviceInfoProvider):
             usage_percent=mem.percent,
             swap_total_bytes=swap.total,
             swap_used_bytes=swap.used
-        )
\ No newline at end of file
+        )
+
+    def get_thermal_info(self) -> ThermalInfo:
+        """Get Windows temperature and fan information."""
+        return self._get_psutil_thermal_info(
+            temperatures=self.has_capability('sensors_temperatures'),
+            fans=self.has_capability('sensors_fans')
+        )
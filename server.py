@@ -1,10 +1,20 @@
 """DeviceMCP - Cross-platform device information MCP server."""
-from typing import List, Dict, Any
+import argparse
+import asyncio
+import os
+from typing import List, Dict, Any, Optional
 
-from fastmcp import FastMCP
+from fastmcp import FastMCP, Context
 
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, StreamingResponse
+
+from utils.disk_usage import scan_disk_usage as _scan_disk_usage
+from utils.export import CONTENT_TYPES, encode_chunks, iter_export, iter_samples
 from utils.formatters import format_bytes, format_time
 from utils.platform_detector import get_device_provider, detect_platform
+from utils.profiling import ToolProfiler
+from utils.sampling import AdaptiveSampler
 
 # Initialize FastMCP server
 mcp = FastMCP("DeviceMCP")
@@ -12,8 +22,44 @@ mcp = FastMCP("DeviceMCP")
 # Get the appropriate device provider for the current platform
 device_provider = get_device_provider()
 
+# Opt-in profiling of tool calls (see profile_tool)
+profiler = ToolProfiler()
+
+# Background metric sampling, off until started (see configure_sampling)
+sampler = AdaptiveSampler(device_provider)
+
+# Directory export_metrics may write to; file export is disabled while unset
+EXPORT_DIR_ENV = "DEVICEMCP_EXPORT_DIR"
+export_dir: Optional[str] = os.environ.get(EXPORT_DIR_ENV) or None
+
+
+def _export_path(path: str) -> str:
+    """
+    Resolve an export file path inside the export directory.
+
+    Raises:
+        ValueError: If file export is disabled or the path leaves the export directory
+    """
+    if export_dir is None:
+        raise ValueError(
+            f"File export is disabled; start the server with --export-dir or set ${EXPORT_DIR_ENV}"
+        )
+    root = os.path.realpath(export_dir)
+    # Resolve symlinks and ".." so neither can point outside the directory
+    resolved = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, resolved]) != root or resolved == root:
+        raise ValueError(f"Export path must be a file inside the export directory: {path}")
+    return resolved
+
+
+def _tool_fn(tool):
+    """Return the plain function behind a registered tool so tools can call each other."""
+    # FastMCP 2.x decorators return a FunctionTool wrapping the function
+    return getattr(tool, 'fn', tool)
+
 
 @mcp.tool()
+@profiler.wrap
 def get_device_info() -> Dict[str, Any]:
     """
     Get comprehensive device information including OS, hostname, architecture, and processor.
@@ -31,6 +77,7 @@ def get_device_info() -> Dict[str, Any]:
 
 
 @mcp.tool()
+@profiler.wrap
 def get_battery_level() -> Dict[str, Any]:
     """
     Get battery information including charge percentage and power status.
@@ -56,6 +103,7 @@ def get_battery_level() -> Dict[str, Any]:
 
 
 @mcp.tool()
+@profiler.wrap
 def get_storage_info() -> List[Dict[str, Any]]:
     """
     Get storage information for all drives/partitions.
@@ -84,6 +132,7 @@ def get_storage_info() -> List[Dict[str, Any]]:
 
 
 @mcp.tool()
+@profiler.wrap
 def get_memory_info() -> Dict[str, Any]:
     """
     Get memory (RAM) information including usage and swap details.
@@ -115,6 +164,230 @@ def get_memory_info() -> Dict[str, Any]:
 
 
 @mcp.tool()
+@profiler.wrap
+def get_thermal_info() -> Dict[str, Any]:
+    """
+    Get temperature and fan sensor readings, e.g. to spot thermal throttling.
+
+    Returns a dictionary containing:
+    - has_sensors: Whether any temperature or fan sensor is available
+    - temperatures: List of temperature sensors, each containing:
+        - chip: Sensor chip or driver name (e.g. coretemp)
+        - label: Sensor label (e.g. Package id 0)
+        - current_celsius: Current temperature
+        - high_celsius: High threshold (None if unknown)
+        - critical_celsius: Critical threshold (None if unknown)
+        - over_high: Whether the current temperature is at or above the high threshold
+    - fans: List of fans (chip, label, rpm)
+    """
+    thermal = device_provider.get_thermal_info()
+    result = thermal.model_dump()
+
+    # Flag sensors at or above their high threshold
+    for sensor, sensor_dict in zip(thermal.temperatures, result['temperatures']):
+        sensor_dict['over_high'] = (
+            sensor.high_celsius is not None and sensor.current_celsius >= sensor.high_celsius
+        )
+
+    return result
+
+
+@mcp.tool()
+@profiler.wrap
+def get_memory_topology() -> Dict[str, Any]:
+    """
+    Get per-NUMA-node memory topology (Linux only; empty elsewhere).
+
+    Returns a dictionary containing:
+    - numa_available: Whether NUMA topology information is available
+    - node_count: Number of NUMA nodes
+    - nodes: List of nodes, each containing:
+        - node_id: NUMA node identifier
+        - cpus: CPUs attached to the node
+        - total_bytes / free_bytes / used_bytes: Node memory in bytes
+        - usage_percent: Node memory usage percentage
+        - hugepages: Hugepage pools (page_size_bytes, total_pages, free_pages, surplus_pages)
+        - distances: Relative access distance to each node
+        - total_formatted / free_formatted / used_formatted: Human-readable sizes
+    """
+    topology = device_provider.get_memory_topology()
+    result = topology.model_dump()
+
+    # Add formatted values
+    for node, node_dict in zip(topology.nodes, result['nodes']):
+        node_dict['total_formatted'] = format_bytes(node.total_bytes)
+        node_dict['free_formatted'] = format_bytes(node.free_bytes)
+        node_dict['used_formatted'] = format_bytes(node.used_bytes)
+
+    return result
+
+
+@mcp.tool()
+@profiler.wrap
+def get_connection_summary(top_n: int = 10) -> Dict[str, Any]:
+    """
+    Get network connection counts by state, local port and remote host (Linux only).
+
+    Much cheaper than listing every connection on hosts with many sockets,
+    since no per-connection or per-process information is collected.
+
+    Args:
+        top_n: Number of local ports and remote hosts to report
+
+    Returns a dictionary containing:
+    - available: Whether connection information is available on this platform
+    - total: Total number of TCP and UDP sockets
+    - by_protocol: Socket count per protocol (tcp, tcp6, udp, udp6)
+    - by_state: TCP socket count per state (ESTABLISHED, TIME_WAIT, LISTEN, ...)
+    - top_local_ports: Local ports with the most sockets (port, count)
+    - top_remote_hosts: Remote hosts with the most connected sockets (host, count)
+    """
+    summary = device_provider.get_connection_summary(top_n=top_n)
+    return summary.model_dump()
+
+
+@mcp.tool()
+@profiler.wrap
+def get_container_usage(top_n: int = 10, sort_by: str = "memory", leaf_only: bool = True) -> Dict[str, Any]:
+    """
+    Get memory, CPU and IO usage per container/cgroup (Linux, cgroup v2 only).
+
+    A parent cgroup's usage includes all of its children, so only leaf cgroups
+    (containers and services) are ranked unless leaf_only is False. CPU usage is
+    measured since the previous call, so cpu_percent is None for cgroups seen
+    for the first time.
+
+    Args:
+        top_n: Number of cgroups to report
+        sort_by: Rank cgroups by "memory", "cpu" or "io"
+        leaf_only: Only rank leaf cgroups (set False to include parent slices)
+
+    Returns a dictionary containing:
+    - cgroup_v2: Whether a cgroup v2 hierarchy is available
+    - cgroup_count: Number of cgroups found in the hierarchy
+    - sort_by: Field the cgroups are ranked by
+    - cgroups: Top cgroups, each containing:
+        - path: cgroup path, e.g. /system.slice/docker-<id>.scope
+        - depth / is_leaf: Depth below the cgroup root and whether it has no children
+        - memory_bytes / memory_limit_bytes: Memory usage and limit (None if unlimited)
+        - cpu_usage_usec: Total CPU time in microseconds
+        - cpu_percent: CPU usage since the previous call, in percent of one CPU
+        - io_read_bytes / io_write_bytes: Total block IO
+        - memory_formatted / io_read_formatted / io_write_formatted: Human-readable sizes
+    """
+    usage = device_provider.get_container_usage(top_n=top_n, sort_by=sort_by, leaf_only=leaf_only)
+    result = usage.model_dump()
+
+    # Add formatted values
+    for cgroup, cgroup_dict in zip(usage.cgroups, result['cgroups']):
+        cgroup_dict['memory_formatted'] = format_bytes(cgroup.memory_bytes)
+        cgroup_dict['io_read_formatted'] = format_bytes(cgroup.io_read_bytes)
+        cgroup_dict['io_write_formatted'] = format_bytes(cgroup.io_write_bytes)
+
+    return result
+
+
+@mcp.tool()
+@profiler.wrap
+async def scan_disk_usage(
+    path: str,
+    depth: int = 1,
+    top_n: int = 10,
+    one_filesystem: bool = True,
+    max_seconds: Optional[float] = 30.0,
+    max_entries: Optional[int] = None,
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """
+    Find which directories use the most space under a path.
+
+    Walks the tree in parallel, counts hardlinked files once and, by default,
+    stays on the filesystem of the given path. Progress notifications are sent
+    while scanning. If a budget is hit, partial results are returned.
+
+    Args:
+        path: Directory to scan
+        depth: Deepest directory level to report (1 = direct children)
+        top_n: Number of largest directories to report per level
+        one_filesystem: Skip directories on other filesystems
+        max_seconds: Time budget in seconds (None for no limit)
+        max_entries: Directory entry budget (None for no limit)
+
+    Returns a dictionary containing:
+    - root: Scanned root directory
+    - total_bytes / total_formatted: Disk usage of the scanned tree
+    - file_count / dir_count / entries_scanned / error_count: Scan counters
+    - elapsed_seconds: Scan time in seconds
+    - partial: Whether a budget stopped the scan early
+    - stop_reason: 'time_budget' or 'entry_budget' when partial
+    - directories: Largest directories per depth (path, depth, size_bytes,
+      file_count, size_formatted)
+    """
+    progress = None
+    if ctx is not None:
+        loop = asyncio.get_running_loop()
+
+        def progress(entries: int, scanned_bytes: int) -> None:
+            message = f"{entries} entries, {format_bytes(scanned_bytes)}"
+            # The entry budget is checked per directory listing, so the count
+            # can overshoot it; keep the reported progress within the total
+            done = entries if max_entries is None else min(entries, max_entries)
+            asyncio.run_coroutine_threadsafe(
+                ctx.report_progress(done, total=max_entries, message=message),
+                loop
+            )
+
+    scan = await asyncio.to_thread(
+        profiler.bind(_scan_disk_usage),
+        path,
+        depth=depth,
+        top_n=top_n,
+        one_filesystem=one_filesystem,
+        max_seconds=max_seconds,
+        max_entries=max_entries,
+        progress=progress,
+        wrap_worker=profiler.bind
+    )
+    result = scan.model_dump()
+
+    # Add formatted values
+    result['total_formatted'] = format_bytes(scan.total_bytes)
+    for directory, directory_dict in zip(scan.directories, result['directories']):
+        directory_dict['size_formatted'] = format_bytes(directory.size_bytes)
+
+    return result
+
+
+@mcp.tool()
+@profiler.wrap
+def get_capabilities(reprobe: bool = False) -> Dict[str, Any]:
+    """
+    Get which optional binaries, sensors and system paths this device has.
+
+    Capabilities are probed once at startup so tools can skip sources that
+    cannot exist here (e.g. battery on a server, termux-api when not installed).
+
+    Args:
+        reprobe: Probe again first, e.g. after installing termux-api
+
+    Returns a dictionary containing:
+    - platform: Detected platform
+    - capabilities: Capability name to availability (e.g. battery, numa, hwmon,
+      thermal_zones, proc_net, termux_api, getprop)
+    - probed_at: Unix timestamp of the last probe
+    """
+    if reprobe:
+        capabilities = device_provider.probe_capabilities()
+    else:
+        capabilities = device_provider.get_capabilities()
+
+    result = capabilities.model_dump()
+    result['platform'] = detect_platform()
+    return result
+
+
+@mcp.tool()
+@profiler.wrap
 def get_system_summary() -> Dict[str, Any]:
     """
     Get a comprehensive summary of all device information in one call.
@@ -124,17 +397,214 @@ def get_system_summary() -> Dict[str, Any]:
     - battery: Battery information
     - storage: Storage information for all drives
     - memory: Memory information
+    - thermal: Temperature and fan information
     - platform: Detected platform
     """
     return {
         "platform": detect_platform(),
-        "device": get_device_info(),
-        "battery": get_battery_level(),
-        "storage": get_storage_info(),
-        "memory": get_memory_info()
+        "device": _tool_fn(get_device_info)(),
+        "battery": _tool_fn(get_battery_level)(),
+        "storage": _tool_fn(get_storage_info)(),
+        "memory": _tool_fn(get_memory_info)(),
+        "thermal": _tool_fn(get_thermal_info)()
     }
 
 
+@mcp.tool()
+def configure_sampling(
+    running: Optional[bool] = None,
+    metric: Optional[str] = None,
+    min_interval: Optional[float] = None,
+    max_interval: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Start/stop background metric sampling and set per-metric interval bounds.
+
+    Each metric's interval adapts to how fast it changes: it backs off while
+    values are stable, tightens when they move, and is stretched while the
+    device runs on battery, always within the metric's floor and ceiling.
+
+    Args:
+        running: True to start sampling, False to stop it
+        metric: Metric whose bounds to change (memory, storage, battery)
+        min_interval: New interval floor in seconds for the metric
+        max_interval: New interval ceiling in seconds for the metric
+
+    Returns the same dictionary as get_sampling_report.
+    """
+    if metric is None and (min_interval is not None or max_interval is not None):
+        raise ValueError("min_interval and max_interval require a metric")
+    if metric is not None:
+        sampler.configure(metric, min_interval=min_interval, max_interval=max_interval)
+    if running is True:
+        sampler.start()
+    elif running is False:
+        sampler.stop()
+
+    return _tool_fn(get_sampling_report)()
+
+
+@mcp.tool()
+def get_sampling_report() -> Dict[str, Any]:
+    """
+    Get the effective sampling rate of each metric.
+
+    Returns a dictionary containing:
+    - running: Whether background sampling is running
+    - on_battery: Whether the device is running on battery power
+    - metrics: List of metrics, each containing:
+        - metric: Metric name
+        - interval_seconds: Current effective sampling interval
+        - min_interval_seconds / max_interval_seconds: Interval floor and ceiling
+        - samples_per_minute: Effective sampling rate
+        - sample_count: Number of samples taken
+        - last_value: Last observed value (usage or battery percentage)
+    """
+    return sampler.report().model_dump()
+
+
+@mcp.tool()
+def export_metrics(
+    path: str,
+    export_format: str = "ndjson",
+    metrics: Optional[List[str]] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Write the sampled metric history to a file as NDJSON, CSV or Arrow IPC.
+
+    History is collected by background sampling (see configure_sampling) and
+    streamed to the file in chunks, so memory use does not depend on the range.
+    Files can only be written inside the server's export directory (--export-dir);
+    over HTTP transport the same export is also served at GET /export.
+
+    Args:
+        path: Output file path, relative to the export directory
+        export_format: "ndjson", "csv" or "arrow" (Arrow requires pyarrow)
+        metrics: Metrics to export: memory, storage, battery (all if not given)
+        start: Only samples at or after this unix timestamp
+        end: Only samples before this unix timestamp
+
+    Returns a dictionary containing:
+    - path: Absolute path of the written file
+    - format: Export format
+    - rows: Number of rows written (one per storage mount point per sample)
+    - bytes: Number of bytes written
+    """
+    output_path = _export_path(path)
+    rows = 0
+
+    def count_rows(chunks):
+        nonlocal rows
+        for chunk in chunks:
+            rows += len(chunk)
+            yield chunk
+
+    encoded = encode_chunks(count_rows(iter_samples(sampler, metrics, start, end)), export_format)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    written = 0
+    with open(output_path, 'wb') as f:
+        for data in encoded:
+            f.write(data)
+            written += len(data)
+
+    return {"path": output_path, "format": export_format, "rows": rows, "bytes": written}
+
+
+@mcp.custom_route("/export", methods=["GET"])
+async def export_metrics_http(request: Request):
+    """Stream the sampled metric history (query: format, metrics, start, end)."""
+    params = request.query_params
+    export_format = params.get("format", "ndjson")
+    metrics = [m for m in params.get("metrics", "").split(",") if m] or None
+    try:
+        start = float(params["start"]) if "start" in params else None
+        end = float(params["end"]) if "end" in params else None
+        body = iter_export(sampler, export_format, metrics, start, end)
+    except (ValueError, ImportError) as e:
+        return PlainTextResponse(str(e), status_code=400)
+
+    return StreamingResponse(body, media_type=CONTENT_TYPES[export_format])
+
+
+@mcp.tool()
+def profile_tool(tool_name: str, calls: int = 1) -> Dict[str, Any]:
+    """
+    Profile the next calls of a tool with cProfile and tracemalloc.
+
+    Profiling is off unless requested. Any earlier profile of the tool is
+    discarded. Fetch the results with get_profile_report.
+
+    Args:
+        tool_name: Name of the tool to profile (e.g. "get_storage_info")
+        calls: Number of upcoming calls to profile
+
+    Returns a dictionary containing:
+    - tool: Tool being profiled
+    - calls: Number of calls that will be profiled
+    """
+    profiler.arm(tool_name, calls)
+    return {"tool": tool_name, "calls": calls}
+
+
+@mcp.tool()
+def get_profile_report(tool_name: str, top_n: int = 20) -> Dict[str, Any]:
+    """
+    Get the aggregated profile of a tool armed with profile_tool.
+
+    Args:
+        tool_name: Name of the profiled tool
+        top_n: Number of hot functions and allocation sites to report
+
+    Returns a dictionary containing:
+    - tool: Profiled tool
+    - calls_profiled: Number of calls profiled so far
+    - calls_remaining: Number of upcoming calls still to be profiled
+    - total_seconds: Wall-clock time of the profiled calls
+    - hot_functions: Functions by cumulative time (function, file, line, calls,
+      total_seconds, cumulative_seconds)
+    - allocation_sites: Lines by net bytes allocated (file, line, size_bytes, count)
+    """
+    return profiler.report(tool_name, top_n=top_n).model_dump()
+
+
+def main() -> None:
+    """Run the DeviceMCP server."""
+    parser = argparse.ArgumentParser(description="DeviceMCP server")
+    parser.add_argument("--transport", choices=["stdio", "http"], default="stdio",
+                        help="Transport to serve on (default: stdio)")
+    parser.add_argument("--host", default="127.0.0.1", help="HTTP host to bind")
+    parser.add_argument("--port", type=int, default=8000, help="HTTP port to bind")
+    parser.add_argument("--profile", action="append", default=[], metavar="TOOL[:CALLS]",
+                        help="Profile the first CALLS calls of TOOL (default 1), repeatable")
+    parser.add_argument("--sample", action="store_true",
+                        help="Start adaptive background metric sampling")
+    parser.add_argument("--export-dir",
+                        help=f"Directory export_metrics may write to (default: ${EXPORT_DIR_ENV}, "
+                             "file export disabled if unset)")
+    args = parser.parse_args()
+
+    global export_dir
+    if args.export_dir:
+        export_dir = args.export_dir
+
+    if args.sample:
+        sampler.start()
+
+    for spec in args.profile:
+        tool_name, _, calls = spec.partition(":")
+        try:
+            profiler.arm(tool_name, int(calls) if calls else 1)
+        except ValueError as e:
+            parser.error(f"--profile {spec}: {e}")
+
+    if args.transport == "http":
+        mcp.run(transport="http", host=args.host, port=args.port)
+    else:
+        # Run the server with stdio transport by default
+        mcp.run()
+
+
 if __name__ == "__main__":
-    # Run the server with stdio transport by default
-    mcp.run()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,50 @@
+"""Tests for capability probing."""
+from core.models import DeviceCapabilities
+from platforms.linux import LinuxDeviceProvider
+from utils.platform_detector import get_device_provider
+
+
+def _write_supply(root, name, supply_type):
+    supply = root / name
+    supply.mkdir()
+    (supply / "type").write_text(supply_type + "\n")
+
+
+def test_capabilities_probed_at_creation():
+    """Test that the provider probes its capabilities when created."""
+    provider = get_device_provider()
+    capabilities = provider.get_capabilities()
+
+    assert isinstance(capabilities, DeviceCapabilities)
+    assert capabilities.probed_at > 0
+    assert all(isinstance(value, bool) for value in capabilities.capabilities.values())
+    assert provider.has_capability("no-such-capability") is False
+
+
+def test_battery_probe_skips_sensor_without_battery(tmp_path, monkeypatch):
+    """Test that a device without a battery never asks psutil for one."""
+    _write_supply(tmp_path, "AC", "Mains")
+    monkeypatch.setattr(LinuxDeviceProvider, "POWER_SUPPLY_PATH", str(tmp_path))
+    provider = LinuxDeviceProvider()
+
+    def fail():
+        raise AssertionError("sensors_battery should not be called")
+
+    monkeypatch.setattr("psutil.sensors_battery", fail)
+    battery = provider.get_battery_level()
+
+    assert not provider.has_capability("battery")
+    assert battery.has_battery is False
+
+
+def test_reprobe_picks_up_changes(tmp_path, monkeypatch):
+    """Test that re-probing notices a battery that appeared."""
+    monkeypatch.setattr(LinuxDeviceProvider, "POWER_SUPPLY_PATH", str(tmp_path))
+    provider = LinuxDeviceProvider()
+    assert not provider.has_capability("battery")
+
+    _write_supply(tmp_path, "BAT0", "Battery")
+    capabilities = provider.probe_capabilities()
+
+    assert capabilities.capabilities["battery"]
+    assert provider.has_capability("battery")
@@ -0,0 +1,71 @@
+"""Tests for the /proc/net connection summary."""
+from core.models import ConnectionSummary
+from platforms.linux import LinuxDeviceProvider, _decode_proc_net_address
+from platforms.macos import MacOSDeviceProvider
+
+TCP_HEADER = (
+    "  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt"
+    "   uid  timeout inode\n"
+)
+TCP_ROW = (
+    "   {sl}: {local} {remote} {state} 00000000:00000000 00:00000000 00000000"
+    "     0        0 {sl} 1 0000000000000000 100 0 0 10 0\n"
+)
+
+
+def _table(rows):
+    """Render /proc/net rows of (local, remote, state)."""
+    return TCP_HEADER + "".join(
+        TCP_ROW.format(sl=i, local=local, remote=remote, state=state)
+        for i, (local, remote, state) in enumerate(rows)
+    )
+
+
+def test_decode_proc_net_address():
+    """Test decoding IPv4 and IPv6 /proc/net addresses."""
+    assert _decode_proc_net_address("0100007F") == "127.0.0.1"
+    assert _decode_proc_net_address("00000000000000000000000001000000") == "::1"
+
+
+def test_connection_summary(tmp_path, monkeypatch):
+    """Test aggregation by protocol, state, local port and remote host."""
+    (tmp_path / "tcp").write_text(_table([
+        ("00000000:01BB", "00000000:0000", "0A"),
+        ("0100000A:01BB", "0C00000A:D431", "01"),
+        ("0100000A:01BB", "0C00000A:D432", "01"),
+        ("0100000A:01BB", "0D00000A:D433", "06"),
+    ]))
+    (tmp_path / "udp").write_text(_table([
+        ("00000000:0035", "00000000:0000", "07"),
+    ]))
+    monkeypatch.setattr(LinuxDeviceProvider, "PROC_NET_PATH", str(tmp_path))
+
+    summary = LinuxDeviceProvider().get_connection_summary(top_n=1)
+
+    assert isinstance(summary, ConnectionSummary)
+    assert summary.available
+    assert summary.total == 5
+    assert summary.by_protocol == {"tcp": 4, "udp": 1}
+    assert summary.by_state == {"ESTABLISHED": 2, "LISTEN": 1, "TIME_WAIT": 1}
+    assert [(p.port, p.count) for p in summary.top_local_ports] == [(443, 4)]
+    assert [(h.host, h.count) for h in summary.top_remote_hosts] == [("10.0.0.12", 2)]
+
+
+def test_connection_summary_unsupported_platform():
+    """Test that platforms without a connection summary report it as unavailable."""
+    summary = MacOSDeviceProvider().get_connection_summary()
+
+    assert not summary.available
+    assert summary.total == 0
+    assert summary.by_protocol == {}
+    assert summary.top_local_ports == []
+
+
+def test_connection_summary_without_proc_net(tmp_path, monkeypatch):
+    """Test that a missing /proc/net is reported as unavailable."""
+    monkeypatch.setattr(LinuxDeviceProvider, "PROC_NET_PATH", str(tmp_path / "missing"))
+
+    summary = LinuxDeviceProvider().get_connection_summary()
+
+    assert not summary.available
+    assert summary.total == 0
@@ -0,0 +1,111 @@
+"""Tests for per-cgroup container usage."""
+import pytest
+from platforms.linux import LinuxDeviceProvider
+from platforms.windows import WindowsDeviceProvider
+
+
+def _write_cgroup(root, path, memory, usage_usec, io_lines=(), memory_max="max"):
+    """Create a fake cgroup v2 directory with its stat files."""
+    cgroup = root.joinpath(*path.strip("/").split("/"))
+    cgroup.mkdir(parents=True, exist_ok=True)
+    (cgroup / "memory.current").write_text(f"{memory}\n")
+    (cgroup / "memory.max").write_text(f"{memory_max}\n")
+    (cgroup / "cpu.stat").write_text(
+        f"usage_usec {usage_usec}\nuser_usec {usage_usec // 2}\nsystem_usec {usage_usec // 2}\n"
+    )
+    (cgroup / "io.stat").write_text("".join(line + "\n" for line in io_lines))
+    return cgroup
+
+
+@pytest.fixture
+def cgroup_root(tmp_path, monkeypatch):
+    (tmp_path / "cgroup.controllers").write_text("cpu io memory pids\n")
+    _write_cgroup(tmp_path, "/system.slice", 3000, 900)
+    _write_cgroup(
+        tmp_path, "/system.slice/docker-a.scope", 2000, 500,
+        io_lines=["8:0 rbytes=100 wbytes=10 rios=1 wios=1", "8:16 rbytes=50 wbytes=5 rios=1 wios=1"],
+        memory_max="4096"
+    )
+    _write_cgroup(tmp_path, "/system.slice/docker-b.scope", 1000, 400)
+    _write_cgroup(tmp_path, "/user.slice", 500, 100)
+    monkeypatch.setattr(LinuxDeviceProvider, "CGROUP_PATH", str(tmp_path))
+    return tmp_path
+
+
+def test_container_usage_ranks_leaf_cgroups(cgroup_root):
+    """Test walking the cgroup tree and ranking leaf cgroups by memory."""
+    usage = LinuxDeviceProvider().get_container_usage(top_n=2)
+
+    assert usage.cgroup_v2
+    assert usage.cgroup_count == 4
+    assert [cgroup.path for cgroup in usage.cgroups] == [
+        "/system.slice/docker-a.scope", "/system.slice/docker-b.scope"
+    ]
+    docker = usage.cgroups[0]
+    assert (docker.depth, docker.is_leaf) == (2, True)
+    assert docker.memory_bytes == 2000
+    assert docker.memory_limit_bytes == 4096
+    assert usage.cgroups[1].memory_limit_bytes is None
+    assert (docker.io_read_bytes, docker.io_write_bytes) == (150, 15)
+    assert docker.cpu_usage_usec == 500
+    assert docker.cpu_percent is None
+
+
+def test_container_usage_can_include_parents(cgroup_root):
+    """Test that parent slices, which include their children, are opt-in."""
+    usage = LinuxDeviceProvider().get_container_usage(top_n=1, leaf_only=False)
+
+    slice_usage, = usage.cgroups
+    assert slice_usage.path == "/system.slice"
+    assert (slice_usage.depth, slice_usage.is_leaf) == (1, False)
+
+
+def test_container_cpu_delta_uses_baselines(cgroup_root, monkeypatch):
+    """Test that CPU usage is measured since the previous call."""
+    now = [100.0]
+    monkeypatch.setattr("platforms.linux.time.monotonic", lambda: now[0])
+    provider = LinuxDeviceProvider()
+
+    provider.get_container_usage()
+    now[0] = 102.0
+    # docker-b used one CPU second over two seconds; docker-a was removed
+    _write_cgroup(cgroup_root, "/system.slice/docker-b.scope", 1000, 1_000_400)
+    for name in ("memory.current", "memory.max", "cpu.stat", "io.stat"):
+        (cgroup_root / "system.slice" / "docker-a.scope" / name).unlink()
+    (cgroup_root / "system.slice" / "docker-a.scope").rmdir()
+
+    usage = provider.get_container_usage(sort_by="cpu")
+
+    assert usage.cgroup_count == 3
+    assert usage.cgroups[0].path == "/system.slice/docker-b.scope"
+    assert usage.cgroups[0].cpu_percent == 50.0
+    assert str(cgroup_root / "system.slice" / "docker-a.scope") not in provider._cgroup_cpu_baselines
+
+
+def test_container_usage_sort_by_io_and_validation(cgroup_root):
+    """Test ranking by IO and rejecting unknown sort keys."""
+    provider = LinuxDeviceProvider()
+
+    usage = provider.get_container_usage(top_n=1, sort_by="io")
+    assert usage.cgroups[0].path == "/system.slice/docker-a.scope"
+
+    with pytest.raises(ValueError):
+        provider.get_container_usage(sort_by="disk")
+
+
+def test_container_usage_unsupported_platform():
+    """Test that platforms without cgroups report no cgroups."""
+    usage = WindowsDeviceProvider().get_container_usage()
+
+    assert not usage.cgroup_v2
+    assert usage.cgroups == []
+
+
+def test_container_usage_without_cgroup_v2(tmp_path, monkeypatch):
+    """Test that hosts without cgroup v2 report no cgroups."""
+    monkeypatch.setattr(LinuxDeviceProvider, "CGROUP_PATH", str(tmp_path))
+
+    usage = LinuxDeviceProvider().get_container_usage()
+
+    assert not usage.cgroup_v2
+    assert usage.cgroups == []
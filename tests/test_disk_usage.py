@@ -0,0 +1,120 @@
+"""Tests for the parallel directory-size scanner."""
+import os
+import threading
+import time
+import pytest
+import utils.disk_usage
+from core.models import DiskUsageScan
+from utils.disk_usage import scan_disk_usage
+
+
+def _write(path, size):
+    """Create a file of the given size with real (non-sparse) blocks."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Build a small tree where 'big' is larger than 'small'."""
+    _write(tmp_path / "big" / "a.bin", 256 * 1024)
+    _write(tmp_path / "big" / "nested" / "b.bin", 256 * 1024)
+    _write(tmp_path / "small" / "c.bin", 16 * 1024)
+    _write(tmp_path / "root.bin", 8 * 1024)
+    return tmp_path
+
+
+def test_scan_ranks_directories(tree):
+    """Test that subtree sizes roll up and are ranked per level."""
+    scan = scan_disk_usage(str(tree), depth=2, top_n=5, max_workers=4)
+
+    assert isinstance(scan, DiskUsageScan)
+    assert not scan.partial
+    assert scan.file_count == 4
+
+    level1 = [d for d in scan.directories if d.depth == 1]
+    assert [os.path.basename(d.path) for d in level1] == ["big", "small"]
+    assert level1[0].file_count == 2
+    assert level1[0].size_bytes >= 512 * 1024
+
+    level2 = [d for d in scan.directories if d.depth == 2]
+    assert [os.path.basename(d.path) for d in level2] == ["nested"]
+    assert scan.total_bytes == sum(d.size_bytes for d in level1) + _disk_size(tree / "root.bin")
+
+
+def test_scan_keeps_top_n(tree):
+    """Test that only the largest directories are kept."""
+    scan = scan_disk_usage(str(tree), depth=1, top_n=1)
+
+    assert [os.path.basename(d.path) for d in scan.directories] == ["big"]
+
+
+def test_scan_counts_hardlinks_once(tmp_path):
+    """Test that hardlinked files are only counted once."""
+    _write(tmp_path / "one" / "data.bin", 64 * 1024)
+    (tmp_path / "two").mkdir()
+    os.link(tmp_path / "one" / "data.bin", tmp_path / "two" / "data.bin")
+
+    scan = scan_disk_usage(str(tmp_path))
+
+    assert scan.file_count == 1
+    assert scan.total_bytes == _disk_size(tmp_path / "one" / "data.bin")
+
+
+def test_scan_entry_budget_returns_partial(tmp_path):
+    """Test that an exhausted entry budget returns partial results."""
+    for i in range(20):
+        _write(tmp_path / f"dir{i}" / "file.bin", 1024)
+
+    progress = []
+    scan = scan_disk_usage(
+        str(tmp_path),
+        max_entries=1,
+        max_workers=1,
+        progress=lambda entries, scanned: progress.append(entries)
+    )
+
+    assert scan.partial
+    assert scan.stop_reason == "entry_budget"
+    assert scan.dir_count < 21
+    assert progress and progress[-1] == scan.entries_scanned
+
+
+def test_scan_time_budget_does_not_wait_for_slow_listing(tmp_path, monkeypatch):
+    """Test that a directory that is slow to list cannot hold the scan past its budget."""
+    _write(tmp_path / "fast" / "file.bin", 1024)
+    (tmp_path / "slow").mkdir()
+    release = threading.Event()
+    scan_directory = utils.disk_usage._scan_directory
+
+    def slow_scan(path, root_dev):
+        if os.path.basename(path) == "slow":
+            release.wait(5)
+        return scan_directory(path, root_dev)
+
+    monkeypatch.setattr(utils.disk_usage, "_scan_directory", slow_scan)
+    try:
+        start = time.monotonic()
+        scan = scan_disk_usage(str(tmp_path), max_seconds=0.3)
+        elapsed = time.monotonic() - start
+    finally:
+        release.set()
+
+    assert elapsed < 2
+    assert scan.partial
+    assert scan.stop_reason == "time_budget"
+    assert scan.directories[0].path == str(tmp_path / "fast")
+    assert scan.file_count == 1
+
+
+def test_scan_rejects_non_directory(tmp_path):
+    """Test that scanning a file raises NotADirectoryError."""
+    _write(tmp_path / "file.bin", 10)
+    with pytest.raises(NotADirectoryError):
+        scan_disk_usage(str(tmp_path / "file.bin"))
+
+
+def _disk_size(path):
+    """Return the on-disk size used by the scanner for a file."""
+    st = os.stat(path)
+    return st.st_blocks * 512 if hasattr(st, "st_blocks") else st.st_size
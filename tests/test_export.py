@@ -0,0 +1,139 @@
+"""Tests for streaming metric history export."""
+import csv
+import io
+import json
+import pytest
+from core.models import BatteryInfo, MemoryInfo, StorageInfo
+from utils.export import COLUMNS, iter_export, iter_samples
+from utils.sampling import AdaptiveSampler
+
+
+class FakeProvider:
+    """Provider with two mount points and a slowly growing memory usage."""
+
+    def __init__(self):
+        self.memory_percent = 10.0
+
+    def get_memory_info(self):
+        self.memory_percent += 1
+        return MemoryInfo(
+            total_bytes=100, available_bytes=50, used_bytes=50,
+            usage_percent=self.memory_percent
+        )
+
+    def get_storage_info(self, path=None):
+        return [
+            StorageInfo(total_bytes=100, used_bytes=10, free_bytes=90, usage_percent=10.0, mount_point="/"),
+            StorageInfo(total_bytes=100, used_bytes=50, free_bytes=50, usage_percent=50.0, mount_point="/data"),
+        ]
+
+    def get_battery_level(self):
+        return BatteryInfo(percentage=80.0, is_charging=False, is_plugged=False)
+
+
+def _sampled(rounds, history_size=1000):
+    """Build a sampler that took every metric once per second, from t=1001."""
+    clock = {"now": 0.0, "wall": 1000.0}
+    sampler = AdaptiveSampler(
+        FakeProvider(),
+        history_size=history_size,
+        clock=lambda: clock["now"],
+        wall_clock=lambda: clock["wall"]
+    )
+    for _ in range(rounds):
+        clock["now"] += 100000
+        clock["wall"] += 1
+        sampler.run_pending()
+    return sampler
+
+
+def test_ndjson_rows_ordered_and_filtered():
+    """Test NDJSON export with time-range and metric filters."""
+    sampler = _sampled(5)
+
+    data = b"".join(iter_export(sampler, "ndjson", metrics=["memory", "storage"], start=1002, end=1004))
+    rows = [json.loads(line) for line in data.decode().splitlines()]
+
+    assert [row["timestamp"] for row in rows] == [1002.0] * 3 + [1003.0] * 3
+    assert [row["metric"] for row in rows[:3]] == ["memory", "storage", "storage"]
+    assert rows[1]["mount_point"] == "/"
+    assert "percentage" not in rows[0]
+
+
+def test_csv_uses_fixed_columns():
+    """Test CSV export has one header and the union of metric columns."""
+    sampler = _sampled(3)
+
+    data = b"".join(iter_export(sampler, "csv", chunk_size=2)).decode()
+    rows = list(csv.DictReader(io.StringIO(data)))
+
+    assert data.count("timestamp,metric") == 1
+    assert list(rows[0]) == COLUMNS
+    assert len(rows) == 3 * 4
+    assert {row["metric"] for row in rows} == {"memory", "storage", "battery"}
+
+
+def test_chunks_are_bounded():
+    """Test that rows are streamed in chunks of at most chunk_size."""
+    sampler = _sampled(20)
+
+    chunks = list(iter_samples(sampler, chunk_size=7))
+
+    assert all(len(chunk) <= 7 for chunk in chunks)
+    assert sum(len(chunk) for chunk in chunks) == 20 * 4
+
+
+def test_history_paging_skips_evicted_samples():
+    """Test paging through a history that is bounded."""
+    sampler = _sampled(10, history_size=4)
+
+    chunks = list(sampler.iter_history("memory", chunk_size=3))
+
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+    assert chunks[0][0][0] == 1007.0
+
+
+def test_arrow_roundtrip():
+    """Test Arrow IPC stream export."""
+    pa = pytest.importorskip("pyarrow")
+    sampler = _sampled(4)
+
+    data = b"".join(iter_export(sampler, "arrow", metrics=["battery"], chunk_size=3))
+    table = pa.ipc.open_stream(data).read_all()
+
+    assert table.num_rows == 4
+    assert table.column_names == COLUMNS
+    assert table.column("percentage").to_pylist() == [80.0] * 4
+
+
+def test_rejects_unknown_metric_and_format():
+    """Test invalid export arguments fail before streaming."""
+    sampler = _sampled(1)
+
+    with pytest.raises(ValueError):
+        iter_samples(sampler, metrics=["cpu"])
+    with pytest.raises(ValueError):
+        iter_export(sampler, "parquet")
+
+
+def test_export_tool_stays_inside_export_dir(tmp_path, monkeypatch):
+    """Test that export_metrics only writes inside the configured export directory."""
+    import server
+
+    export_metrics = server._tool_fn(server.export_metrics)
+    monkeypatch.setattr(server, "export_dir", None)
+    with pytest.raises(ValueError, match="disabled"):
+        export_metrics("metrics.ndjson")
+
+    exports = tmp_path / "exports"
+    exports.mkdir()
+    (exports / "link").symlink_to(tmp_path)
+    monkeypatch.setattr(server, "export_dir", str(exports))
+    for path in ("../outside.ndjson", str(tmp_path / "outside.ndjson"), "link/outside.ndjson", "."):
+        with pytest.raises(ValueError, match="inside the export directory"):
+            export_metrics(path)
+    assert not (tmp_path / "outside.ndjson").exists()
+
+    result = export_metrics("daily/metrics.csv", export_format="csv")
+    assert result["path"] == str((exports / "daily" / "metrics.csv").resolve())
+    assert (exports / "daily" / "metrics.csv").read_text().startswith("timestamp,metric")
@@ -0,0 +1,160 @@
+"""Tests for the fleet aggregator."""
+import asyncio
+import os
+from fastmcp.exceptions import ToolError
+import fleet as fleet_module
+from fleet import FleetAggregator
+
+SERVER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "server.py")
+
+
+class FakeFleet(FleetAggregator):
+    """Fleet aggregator answering from canned per-host results."""
+
+    def __init__(self, responses, **kwargs):
+        super().__init__(list(responses), **kwargs)
+        self.responses = responses
+
+    async def _call_host(self, endpoint, tool, arguments):
+        response = self.responses[endpoint][tool]
+        if isinstance(response, Exception):
+            raise response
+        if response == "hang":
+            await asyncio.sleep(10)
+        return response
+
+
+class FakeClient:
+    """Client stand-in that records how many connections are opened."""
+
+    instances = []
+
+    # Per tool: an exception to raise, or seconds to take before answering
+    behaviour = {}
+
+    def __init__(self, endpoint):
+        self.connected = False
+        FakeClient.instances.append(self)
+
+    async def call_tool(self, tool, arguments):
+        behaviour = FakeClient.behaviour.get(tool, 0)
+        if isinstance(behaviour, Exception):
+            raise behaviour
+        await asyncio.sleep(behaviour)
+        return type("Result", (), {"structured_content": {"tool": tool}})()
+
+    def is_connected(self):
+        return self.connected
+
+    async def __aenter__(self):
+        await asyncio.sleep(0.05)
+        self.connected = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.connected = False
+
+
+def _storage(*usages):
+    return [
+        {"mount_point": f"/mnt/{i}", "usage_percent": usage, "free_bytes": 100 - usage}
+        for i, usage in enumerate(usages)
+    ]
+
+
+def test_top_storage_usage_merges_hosts():
+    """Test ranking hosts by their fullest mount point."""
+    fleet = FakeFleet({
+        "a": {"get_storage_info": _storage(10.0, 95.0)},
+        "b": {"get_storage_info": _storage(50.0)},
+        "c": {"get_storage_info": ConnectionError("refused")},
+    })
+
+    merged = asyncio.run(fleet.top_storage_usage(limit=1))
+
+    assert merged["hosts"] == [
+        {"endpoint": "a", "mount_point": "/mnt/1", "usage_percent": 95.0, "free_bytes": 5.0}
+    ]
+    assert merged["failed"] == [{"endpoint": "c", "error": "refused"}]
+
+
+def test_low_battery_and_deadline():
+    """Test the battery filter and that slow hosts are cut off at the deadline."""
+    fleet = FakeFleet({
+        "laptop": {"get_battery_level": {"has_battery": True, "percentage": 12.0, "is_plugged": False}},
+        "server": {"get_battery_level": {"has_battery": False, "percentage": None}},
+        "phone": {"get_battery_level": {"has_battery": True, "percentage": 80.0, "is_plugged": True}},
+        "slow": {"get_battery_level": "hang"},
+    }, deadline=0.2)
+
+    merged = asyncio.run(fleet.low_battery(threshold=20))
+
+    assert merged["hosts"] == [{"endpoint": "laptop", "percentage": 12.0, "is_plugged": False}]
+    assert merged["failed"] == [{"endpoint": "slow", "error": "Deadline of 0.2s exceeded"}]
+
+
+def test_concurrent_queries_share_one_connection(monkeypatch):
+    """Test that concurrent queries to one endpoint open a single connection."""
+    FakeClient.instances = []
+    monkeypatch.setattr(fleet_module, "Client", FakeClient)
+
+    async def run():
+        fleet = FleetAggregator(["a"])
+        clients = await asyncio.gather(fleet._get_client("a"), fleet._get_client("a"))
+        await fleet.close()
+        return clients
+
+    first, second = asyncio.run(run())
+
+    assert first is second
+    assert len(FakeClient.instances) == 1
+    assert not any(client.connected for client in FakeClient.instances)
+
+
+def test_tool_error_keeps_connection_and_timeout_spares_other_queries(monkeypatch):
+    """Test that only transport failures drop a pooled connection, once unused."""
+    FakeClient.instances = []
+    FakeClient.behaviour = {"missing_tool": ToolError("Unknown tool"), "slow": 0.3, "medium": 0.15}
+    monkeypatch.setattr(fleet_module, "Client", FakeClient)
+
+    async def run():
+        fleet = FleetAggregator(["a"], deadline=1)
+        errors = await fleet.query("missing_tool")
+        again = await fleet.query("missing_tool")
+        pooled = fleet._clients["a"]
+        # The slow query misses its deadline while the medium one is still running
+        slow, medium = await asyncio.gather(
+            fleet.query("slow", deadline=0.05), fleet.query("medium")
+        )
+        await fleet.close()
+        return errors, again, pooled, slow, medium
+
+    errors, again, pooled, slow, medium = asyncio.run(run())
+
+    assert not errors[0].ok and errors[0].error == "Unknown tool"
+    assert not again[0].ok
+    assert pooled is FakeClient.instances[0]
+    assert not slow[0].ok
+    assert medium[0].ok and medium[0].data == {"tool": "medium"}
+    assert len(FakeClient.instances) == 1
+    assert not FakeClient.instances[0].connected
+
+
+def test_query_local_server_processes():
+    """Test fanning out to several real DeviceMCP server processes."""
+    # Distinct endpoint strings for the same script spawn separate processes
+    endpoints = [SERVER, os.path.relpath(SERVER), "http://127.0.0.1:1/mcp"]
+
+    async def run():
+        async with FleetAggregator(endpoints, deadline=30) as fleet:
+            first = await fleet.query("get_system_summary")
+            second = await fleet.query("get_storage_info")
+            return first, second
+
+    first, second = asyncio.run(run())
+
+    assert [result.ok for result in first] == [True, True, False]
+    for result in first[:2]:
+        assert set(result.data) >= {"platform", "device", "battery", "storage", "memory"}
+    assert isinstance(second[0].data, list)
+    assert first[2].error
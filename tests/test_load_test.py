@@ -0,0 +1,25 @@
+"""Tests for the load test's mix parsing and percentiles."""
+import pytest
+from benchmarks.load_test import parse_mix, percentile
+
+
+def test_parse_mix():
+    """Test parsing tool weights, defaulting to 1.0."""
+    assert parse_mix("get_device_info=2, get_storage_info,") == {
+        "get_device_info": 2.0, "get_storage_info": 1.0
+    }
+
+    with pytest.raises(ValueError):
+        parse_mix(" , ")
+
+
+def test_percentile_nearest_rank():
+    """Test that percentiles use the nearest rank."""
+    values = [float(i) for i in range(1, 101)]
+
+    assert percentile(values, 0.99) == 99.0
+    assert percentile(values, 0.5) == 50.0
+    assert percentile(values, 1.0) == 100.0
+    assert percentile([1.0, 2.0], 0.5) == 1.0
+    assert percentile([1.0, 2.0], 0.0) == 1.0
+    assert percentile([], 0.5) is None
@@ -0,0 +1,76 @@
+"""Tests for NUMA memory topology reporting."""
+from core.models import MemoryTopology
+from platforms.linux import LinuxDeviceProvider, _parse_cpulist
+from platforms.windows import WindowsDeviceProvider
+
+
+def _write_node(root, node_id, total_kb, free_kb, cpulist, hugepages_2m=(0, 0)):
+    """Create a fake sysfs NUMA node directory."""
+    node = root / f"node{node_id}"
+    node.mkdir()
+    (node / "meminfo").write_text(
+        f"Node {node_id} MemTotal:       {total_kb} kB\n"
+        f"Node {node_id} MemFree:        {free_kb} kB\n"
+        f"Node {node_id} MemUsed:        {total_kb - free_kb} kB\n"
+        f"Node {node_id} HugePages_Total:     {hugepages_2m[0]}\n"
+        f"Node {node_id} HugePages_Free:      {hugepages_2m[1]}\n"
+    )
+    (node / "cpulist").write_text(cpulist + "\n")
+    (node / "distance").write_text("10 21\n" if node_id == 0 else "21 10\n")
+    pool = node / "hugepages" / "hugepages-2048kB"
+    pool.mkdir(parents=True)
+    (pool / "nr_hugepages").write_text(f"{hugepages_2m[0]}\n")
+    (pool / "free_hugepages").write_text(f"{hugepages_2m[1]}\n")
+    (pool / "surplus_hugepages").write_text("0\n")
+
+
+def test_parse_cpulist():
+    """Test expanding sysfs CPU lists."""
+    assert _parse_cpulist("0-3,8-9,12\n") == [0, 1, 2, 3, 8, 9, 12]
+    assert _parse_cpulist("") == []
+
+
+def test_memory_topology_per_node(tmp_path, monkeypatch):
+    """Test that per-node stats are read from sysfs."""
+    _write_node(tmp_path, 0, 1024, 0, "0-1", hugepages_2m=(4, 1))
+    _write_node(tmp_path, 1, 2048, 1536, "2-3")
+    (tmp_path / "online").write_text("0-1\n")
+    monkeypatch.setattr(LinuxDeviceProvider, "NUMA_NODE_PATH", str(tmp_path))
+
+    topology = LinuxDeviceProvider().get_memory_topology()
+
+    assert isinstance(topology, MemoryTopology)
+    assert topology.numa_available
+    assert topology.node_count == 2
+
+    node0, node1 = topology.nodes
+    assert node0.cpus == [0, 1]
+    assert node0.total_bytes == 1024 * 1024
+    assert node0.usage_percent == 100.0
+    assert node0.distances == [10, 21]
+    assert node0.hugepages[0].page_size_bytes == 2 * 1024 * 1024
+    assert node0.hugepages[0].total_pages == 4
+    assert node0.hugepages[0].free_pages == 1
+
+    assert node1.cpus == [2, 3]
+    assert node1.free_bytes == 1536 * 1024
+    assert node1.usage_percent == 25.0
+
+
+def test_memory_topology_unavailable(tmp_path, monkeypatch):
+    """Test that a missing sysfs node directory reports no NUMA support."""
+    monkeypatch.setattr(LinuxDeviceProvider, "NUMA_NODE_PATH", str(tmp_path / "missing"))
+
+    topology = LinuxDeviceProvider().get_memory_topology()
+
+    assert not topology.numa_available
+    assert topology.nodes == []
+
+
+def test_memory_topology_unsupported_platform():
+    """Test that platforms without NUMA support report no topology."""
+    topology = WindowsDeviceProvider().get_memory_topology()
+
+    assert not topology.numa_available
+    assert topology.node_count == 0
+    assert topology.nodes == []
@@ -0,0 +1,121 @@
+"""Tests for on-demand tool profiling."""
+import asyncio
+import pytest
+from core.models import ProfileReport
+import utils.profiling as profiling
+from utils.disk_usage import scan_disk_usage
+from utils.profiling import ToolProfiler
+
+
+def _make_tools(profiler):
+    """Register a sync and an async tool with the profiler."""
+    @profiler.wrap
+    def build_list(n: int = 1000):
+        return [str(i) for i in range(n)]
+
+    @profiler.wrap
+    async def build_list_async(n: int = 1000):
+        await asyncio.sleep(0)
+        return build_list(n)
+
+    return build_list, build_list_async
+
+
+def test_unarmed_tool_runs_unprofiled():
+    """Test that wrapped tools behave normally while profiling is off."""
+    profiler = ToolProfiler()
+    build_list, _ = _make_tools(profiler)
+
+    assert build_list(3) == ["0", "1", "2"]
+    assert build_list.__name__ == "build_list"
+    with pytest.raises(ValueError):
+        profiler.report("build_list")
+
+
+def test_profiles_next_n_calls():
+    """Test that only the armed number of calls is profiled."""
+    profiler = ToolProfiler()
+    build_list, _ = _make_tools(profiler)
+
+    profiler.arm("build_list", calls=2)
+    for _ in range(3):
+        build_list(20000)
+
+    report = profiler.report("build_list", top_n=5)
+    assert isinstance(report, ProfileReport)
+    assert report.calls_profiled == 2
+    assert report.calls_remaining == 0
+    assert any(f.function == "build_list" and f.calls == 2 for f in report.hot_functions)
+    assert len(report.hot_functions) <= 5
+
+
+def test_profiles_async_tool_and_skips_nested_calls():
+    """Test async tools are profiled and nested armed tools are not double-profiled."""
+    profiler = ToolProfiler()
+    build_list, build_list_async = _make_tools(profiler)
+
+    profiler.arm("build_list_async")
+    profiler.arm("build_list")
+    asyncio.run(build_list_async(10))
+
+    assert profiler.report("build_list_async").calls_profiled == 1
+    # The nested call ran inside the async tool's profile, so it is still armed
+    assert profiler.report("build_list").calls_remaining == 1
+
+
+def test_async_tool_profiles_worker_thread_not_event_loop():
+    """Test that an async tool's report holds its threaded work, not the event loop."""
+    profiler = ToolProfiler()
+
+    def crunch(n):
+        return sorted(str(i) for i in range(n))
+
+    @profiler.wrap
+    async def scan(n: int = 50000):
+        await asyncio.sleep(0.2)
+        return await asyncio.to_thread(profiler.bind(crunch), n)
+
+    profiler.arm("scan")
+    asyncio.run(scan())
+
+    report = profiler.report("scan", top_n=50)
+    functions = {f.function for f in report.hot_functions}
+    assert report.calls_profiled == 1
+    assert report.total_seconds >= 0.2
+    assert "crunch" in functions
+    assert not any("select" in function or "poll" in function for function in functions)
+
+
+def test_async_tool_profiles_thread_pool_workers(tmp_path):
+    """Test that bound work fanned out to a thread pool is in the report."""
+    profiler = ToolProfiler()
+    for i in range(20):
+        (tmp_path / f"dir{i}").mkdir()
+        (tmp_path / f"dir{i}" / "file").write_text("x")
+
+    @profiler.wrap
+    async def scan():
+        return await asyncio.to_thread(
+            profiler.bind(scan_disk_usage), str(tmp_path), max_workers=4,
+            wrap_worker=profiler.bind
+        )
+
+    profiler.arm("scan")
+    asyncio.run(scan())
+
+    report = profiler.report("scan", top_n=100)
+    listings = [f for f in report.hot_functions if f.function == "_scan_directory"]
+    assert listings and listings[0].calls == 21
+    assert any("scandir" in f.function for f in report.hot_functions)
+    assert not any(f.file == profiling.__file__ for f in report.hot_functions)
+
+
+def test_arm_rejects_unknown_tool():
+    """Test that only wrapped tools can be armed."""
+    profiler = ToolProfiler()
+    _make_tools(profiler)
+
+    with pytest.raises(ValueError):
+        profiler.arm("missing")
+    with pytest.raises(ValueError):
+        profiler.arm("build_list", calls=0)
@@ -0,0 +1,144 @@
+"""Tests for the adaptive sampling scheduler."""
+import time
+import pytest
+from core.models import BatteryInfo, MemoryInfo, StorageInfo, SamplingReport
+from utils.sampling import AdaptiveSampler
+
+
+class FakeProvider:
+    """Provider returning scripted memory usage and power state."""
+
+    def __init__(self):
+        self.memory_percent = 50.0
+        self.battery = BatteryInfo(has_battery=False)
+
+    def get_memory_info(self):
+        return MemoryInfo(
+            total_bytes=100, available_bytes=50, used_bytes=50,
+            usage_percent=self.memory_percent
+        )
+
+    def get_storage_info(self, path=None):
+        return [StorageInfo(
+            total_bytes=100, used_bytes=10, free_bytes=90, usage_percent=10.0, mount_point="/"
+        )]
+
+    def get_battery_level(self):
+        return self.battery
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _make_sampler(provider, clock, **kwargs):
+    return AdaptiveSampler(
+        provider,
+        schedules={
+            "memory": (1.0, 16.0, 4.0, 1.0),
+            "battery": (10.0, 100.0, 10.0, 1.0),
+        },
+        clock=clock,
+        **kwargs
+    )
+
+
+def _interval(sampler, metric):
+    return next(m for m in sampler.report().metrics if m.metric == metric).interval_seconds
+
+
+def test_backs_off_when_stable_and_tightens_when_moving():
+    """Test that the interval follows the metric's rate of change."""
+    provider, clock = FakeProvider(), FakeClock()
+    sampler = _make_sampler(provider, clock, backoff_factor=2.0)
+
+    for _ in range(5):
+        sampler.run_pending()
+        clock.now += 100
+    assert _interval(sampler, "memory") == 16.0  # Capped at the ceiling
+
+    provider.memory_percent = 80.0
+    sampler.run_pending()
+    assert _interval(sampler, "memory") == 8.0
+
+    assert len(sampler.history("memory")) == 6
+
+
+def test_stretches_intervals_on_battery():
+    """Test that running on battery lengthens every interval within its bounds."""
+    provider, clock = FakeProvider(), FakeClock()
+    provider.battery = BatteryInfo(percentage=60.0, is_charging=False, is_plugged=False)
+    sampler = _make_sampler(provider, clock, battery_factor=3.0)
+
+    sampler.run_pending()
+
+    report = sampler.report()
+    assert isinstance(report, SamplingReport)
+    assert report.on_battery
+    assert _interval(sampler, "memory") == 12.0
+    assert _interval(sampler, "battery") == 30.0
+
+
+def test_configure_bounds():
+    """Test changing a metric's floor and ceiling."""
+    provider, clock = FakeProvider(), FakeClock()
+    sampler = _make_sampler(provider, clock)
+
+    sampler.configure("memory", max_interval=2.0)
+    assert _interval(sampler, "memory") == 2.0
+
+    with pytest.raises(ValueError):
+        sampler.configure("memory", min_interval=5.0)
+    with pytest.raises(ValueError):
+        sampler.configure("cpu", min_interval=1.0)
+
+
+def test_background_thread_start_stop():
+    """Test that the sampler collects in the background until stopped."""
+    sampler = _make_sampler(FakeProvider(), FakeClock())
+
+    sampler.start()
+    assert sampler.running
+    sampler.stop(timeout=5)
+
+    assert not sampler.running
+    assert len(sampler.history("memory")) >= 1
+
+
+def test_power_change_reschedules_other_metrics():
+    """Test that switching to battery pushes back samples already scheduled."""
+    provider, clock = FakeProvider(), FakeClock()
+    sampler = AdaptiveSampler(
+        provider,
+        schedules={
+            "memory": (1.0, 16.0, 8.0, 1.0),
+            "battery": (1.0, 100.0, 2.0, 1.0),
+        },
+        clock=clock,
+        battery_factor=2.0
+    )
+    sampler.run_pending()
+
+    provider.battery = BatteryInfo(percentage=60.0, is_charging=False, is_plugged=False)
+    clock.now = 2.0
+    sampler.run_pending()
+
+    assert _interval(sampler, "memory") == 16.0
+    assert sampler._schedules["memory"].next_due == 16.0
+
+
+def test_configure_wakes_background_thread():
+    """Test that a running sampler picks up a shorter interval immediately."""
+    sampler = AdaptiveSampler(FakeProvider(), schedules={"memory": (60.0, 600.0, 600.0, 1.0)})
+    sampler.start()
+    try:
+        sampler.configure("memory", min_interval=0.05, max_interval=0.1)
+        time.sleep(0.5)
+    finally:
+        sampler.stop(timeout=5)
+
+    assert len(sampler.history("memory")) >= 3
@@ -0,0 +1,105 @@
+"""Tests for thermal and fan sensor information."""
+import psutil
+import platforms.linux
+from core.base import DeviceInfoProvider
+from core.models import ThermalInfo
+from platforms.linux import LinuxDeviceProvider
+from utils.platform_detector import get_device_provider
+
+
+def _write_hwmon(root):
+    """Create a fake hwmon device with one temperature and one fan input."""
+    device = root / "hwmon0"
+    device.mkdir()
+    (device / "name").write_text("coretemp\n")
+    (device / "temp1_label").write_text("Package id 0\n")
+    (device / "temp1_input").write_text("54000\n")
+    (device / "temp1_max").write_text("84000\n")
+    (device / "temp1_crit").write_text("100000\n")
+    (device / "temp2_input").write_text("41500\n")
+    (device / "fan1_input").write_text("2100\n")
+    return device
+
+
+def test_thermal_info():
+    """Test getting thermal information on the current platform."""
+    thermal = get_device_provider().get_thermal_info()
+
+    assert isinstance(thermal, ThermalInfo)
+    assert thermal.has_sensors == bool(thermal.temperatures or thermal.fans)
+
+
+def test_hwmon_sensors_and_thresholds(tmp_path, monkeypatch):
+    """Test reading hwmon temperatures, thresholds and fans."""
+    _write_hwmon(tmp_path)
+    monkeypatch.setattr(LinuxDeviceProvider, "HWMON_PATH", str(tmp_path))
+
+    thermal = LinuxDeviceProvider().get_thermal_info()
+
+    assert thermal.has_sensors
+    package, second = thermal.temperatures
+    assert (package.chip, package.label) == ("coretemp", "Package id 0")
+    assert package.current_celsius == 54.0
+    assert package.high_celsius == 84.0
+    assert package.critical_celsius == 100.0
+    assert second.label == "temp2"
+    assert second.high_celsius is None
+    assert [(fan.label, fan.rpm) for fan in thermal.fans] == [("fan1", 2100)]
+
+
+def test_hwmon_discovery_is_cached(tmp_path, monkeypatch):
+    """Test that discovery runs once and only input files are re-read."""
+    device = _write_hwmon(tmp_path)
+    monkeypatch.setattr(LinuxDeviceProvider, "HWMON_PATH", str(tmp_path))
+    provider = LinuxDeviceProvider()
+    provider.get_thermal_info()
+
+    # New sensors are not picked up, but new readings are
+    (device / "temp3_input").write_text("30000\n")
+    (device / "temp1_input").write_text("90000\n")
+    thermal = provider.get_thermal_info()
+    assert len(thermal.temperatures) == 2
+    assert thermal.temperatures[0].current_celsius == 90.0
+
+    # A vanished input drops the cache so the next call rediscovers
+    (device / "temp2_input").unlink()
+    assert len(provider.get_thermal_info().temperatures) == 1
+    assert len(provider.get_thermal_info().temperatures) == 2
+
+
+def test_transient_read_errors_keep_cache(tmp_path, monkeypatch):
+    """Test that an input failing to read (e.g. EIO) is skipped without rediscovery."""
+    device = _write_hwmon(tmp_path)
+    monkeypatch.setattr(LinuxDeviceProvider, "HWMON_PATH", str(tmp_path))
+    discoveries = []
+    discover = platforms.linux._discover_hwmon
+    monkeypatch.setattr(
+        platforms.linux, "_discover_hwmon",
+        lambda root: discoveries.append(root) or discover(root)
+    )
+    provider = LinuxDeviceProvider()
+    provider.get_thermal_info()
+
+    # Reading a directory fails with an OSError other than FileNotFoundError
+    (device / "temp2_input").unlink()
+    (device / "temp2_input").mkdir()
+    for _ in range(3):
+        thermal = provider.get_thermal_info()
+
+    assert [sensor.label for sensor in thermal.temperatures] == ["Package id 0"]
+    assert len(discoveries) == 1
+
+
+def test_default_thermal_info_without_sensor_support(monkeypatch):
+    """Test that providers without their own thermal support fall back to psutil."""
+    Provider = type("Provider", (DeviceInfoProvider,), {
+        name: lambda self, *args, **kwargs: None
+        for name in DeviceInfoProvider.__abstractmethods__
+    })
+    monkeypatch.delattr(psutil, "sensors_temperatures", raising=False)
+    monkeypatch.delattr(psutil, "sensors_fans", raising=False)
+
+    thermal = Provider().get_thermal_info()
+
+    assert not thermal.has_sensors
+    assert thermal.temperatures == [] and thermal.fans == []
@@ -1,11 +1,19 @@
 """Utility functions for DeviceMCP."""
 from .platform_detector import detect_platform, get_device_provider
 from .formatters import format_bytes, format_time, format_percentage
+from .disk_usage import scan_disk_usage
+from .profiling import ToolProfiler
+from .sampling import AdaptiveSampler
+from .export import iter_export
 
 __all__ = [
     "detect_platform",
     "get_device_provider",
     "format_bytes",
     "format_time",
-    "format_percentage"
+    "format_percentage",
+    "scan_disk_usage",
+    "ToolProfiler",
+    "AdaptiveSampler",
+    "iter_export"
 ]
\ No newline at end of file
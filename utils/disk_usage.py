@@ -0,0 +1,280 @@
+"""Parallel directory-size scanner."""
+import contextvars
+import heapq
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, List, Optional, Tuple
+from core.models import DirectoryUsage, DiskUsageScan
+
+# Called with (entries_scanned, bytes_counted) while a scan is running
+ProgressCallback = Callable[[int, int], None]
+
+
+def _entry_size(st: os.stat_result) -> int:
+    """Return the on-disk size of a file, falling back to its apparent size."""
+    blocks = getattr(st, 'st_blocks', None)
+    if blocks is not None:
+        return blocks * 512
+    return st.st_size
+
+
+def _scan_directory(path: str, root_dev: Optional[int]):
+    """
+    List a single directory without recursing.
+
+    Args:
+        path: Directory to list
+        root_dev: Device id to stay on, or None to cross filesystems
+
+    Returns:
+        tuple: (file_bytes, file_count, subdirs, hardlinks, entry_count, error_count)
+    """
+    file_bytes = 0
+    file_count = 0
+    entry_count = 0
+    error_count = 0
+    subdirs = []
+    hardlinks = []
+
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                entry_count += 1
+                try:
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if root_dev is not None:
+                            if entry.stat(follow_symlinks=False).st_dev != root_dev:
+                                continue
+                        subdirs.append(entry.path)
+                        continue
+
+                    st = entry.stat(follow_symlinks=False)
+                    if st.st_nlink > 1:
+                        # Deduplicated by the caller across all directories
+                        hardlinks.append((st.st_dev, st.st_ino, _entry_size(st)))
+                    else:
+                        file_bytes += _entry_size(st)
+                        file_count += 1
+                except OSError:
+                    error_count += 1
+    except OSError:
+        error_count += 1
+
+    return file_bytes, file_count, subdirs, hardlinks, entry_count, error_count
+
+
+class _Node:
+    """Running totals for a directory tracked at or above the reporting depth."""
+
+    __slots__ = ('path', 'depth', 'parent', 'size', 'files', 'pending')
+
+    def __init__(self, path: str, depth: int, parent: Optional['_Node']):
+        self.path = path
+        self.depth = depth
+        self.parent = parent
+        self.size = 0
+        self.files = 0
+        # Outstanding directory scans and unfinished child nodes
+        self.pending = 0
+
+
+def scan_disk_usage(
+    path: str,
+    depth: int = 1,
+    top_n: int = 10,
+    one_filesystem: bool = True,
+    max_seconds: Optional[float] = None,
+    max_entries: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    progress_interval: float = 0.5,
+    wrap_worker: Optional[Callable[[Callable], Callable]] = None
+) -> DiskUsageScan:
+    """
+    Find where the space under a directory is used.
+
+    Directories are listed in parallel with os.scandir. Only directories down to
+    ``depth`` are tracked and each is released as soon as its subtree is done, so
+    memory stays bounded by the in-flight frontier and the top-N heaps rather
+    than by the size of the tree.
+
+    Args:
+        path: Directory to scan
+        depth: Deepest directory level to report (1 = direct children)
+        top_n: Number of largest directories to keep per level
+        one_filesystem: Skip directories on other filesystems (like ``du -x``)
+        max_seconds: Stop and return partial results after this many seconds
+        max_entries: Stop and return partial results after this many entries
+        max_workers: Number of scanning threads
+        progress: Optional callback receiving (entries_scanned, bytes_counted)
+        progress_interval: Minimum seconds between progress callbacks
+        wrap_worker: Optional wrapper for the per-directory listing function run
+            in the scanning threads (e.g. ToolProfiler.bind); listings run in a
+            copy of the caller's context
+
+    Returns:
+        DiskUsageScan: Scan result with the largest directories per level
+
+    Raises:
+        NotADirectoryError: If path is not a directory
+    """
+    root = os.path.abspath(path)
+    if not os.path.isdir(root):
+        raise NotADirectoryError(f"Not a directory: {path}")
+
+    depth = max(depth, 0)
+    top_n = max(top_n, 1)
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    root_dev = os.stat(root).st_dev if one_filesystem else None
+    start = time.monotonic()
+
+    heaps: Dict[int, List[Tuple[int, int, str, int]]] = {}
+    seen_inodes = set()
+    counter = 0
+    total_bytes = 0
+    entries_scanned = 0
+    dir_count = 0
+    error_count = 0
+    stop_reason = None
+    last_progress = start
+
+    def finalize(node: _Node) -> None:
+        nonlocal counter
+        # Walk up while completing a node also completes its parent
+        while node is not None:
+            if node.depth > 0:
+                heap = heaps.setdefault(node.depth, [])
+                counter += 1
+                item = (node.size, counter, node.path, node.files)
+                if len(heap) < top_n:
+                    heapq.heappush(heap, item)
+                elif item[0] > heap[0][0]:
+                    heapq.heapreplace(heap, item)
+            parent = node.parent
+            if parent is None:
+                return
+            parent.size += node.size
+            parent.files += node.files
+            parent.pending -= 1
+            if parent.pending > 0:
+                return
+            node = parent
+
+    def complete(node: _Node) -> None:
+        node.pending -= 1
+        if node.pending == 0:
+            finalize(node)
+
+    scan_directory = _scan_directory if wrap_worker is None else wrap_worker(_scan_directory)
+
+    root_node = _Node(root, 0, None)
+    root_node.pending = 1
+    # Depth-first work stack of (directory path, directory depth, owning node)
+    stack = [(root, 0, root_node)]
+    running = {}
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        while stack or running:
+            if stop_reason is None:
+                if max_seconds is not None and time.monotonic() - start >= max_seconds:
+                    stop_reason = 'time_budget'
+                elif max_entries is not None and entries_scanned >= max_entries:
+                    stop_reason = 'entry_budget'
+
+            if stop_reason is not None:
+                # Abandon unscanned directories, but let their owners complete
+                while stack:
+                    complete(stack.pop()[2])
+                if stop_reason == 'time_budget':
+                    # Do not wait for in-flight listings either; a slow or hung
+                    # mount must not hold the scan past its budget
+                    for future, (_, node) in running.items():
+                        future.cancel()
+                        complete(node)
+                    running.clear()
+            else:
+                while stack and len(running) < max_workers * 2:
+                    dir_path, dir_depth, node = stack.pop()
+                    future = executor.submit(
+                        contextvars.copy_context().run, scan_directory, dir_path, root_dev
+                    )
+                    running[future] = (dir_depth, node)
+
+            if not running:
+                break
+
+            timeout = None
+            if max_seconds is not None and stop_reason is None:
+                timeout = max(max_seconds - (time.monotonic() - start), 0.0)
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                dir_depth, node = running.pop(future)
+                file_bytes, file_count, subdirs, hardlinks, entry_count, errors = future.result()
+
+                for dev, ino, size in hardlinks:
+                    if (dev, ino) not in seen_inodes:
+                        seen_inodes.add((dev, ino))
+                        file_bytes += size
+                        file_count += 1
+
+                node.size += file_bytes
+                node.files += file_count
+                total_bytes += file_bytes
+                entries_scanned += entry_count
+                error_count += errors
+                dir_count += 1
+
+                if stop_reason is None:
+                    child_depth = dir_depth + 1
+                    for subdir in subdirs:
+                        if child_depth <= depth:
+                            child = _Node(subdir, child_depth, node)
+                            child.pending = 1
+                            node.pending += 1
+                            stack.append((subdir, child_depth, child))
+                        else:
+                            node.pending += 1
+                            stack.append((subdir, child_depth, node))
+
+                complete(node)
+
+            if progress is not None:
+                now = time.monotonic()
+                if now - last_progress >= progress_interval:
+                    last_progress = now
+                    progress(entries_scanned, total_bytes)
+    finally:
+        # Leave abandoned listings running in the background instead of joining them
+        executor.shutdown(wait=stop_reason is None, cancel_futures=True)
+
+    directories = []
+    for level in sorted(heaps):
+        for size, _, dir_path, files in sorted(heaps[level], reverse=True):
+            directories.append(DirectoryUsage(
+                path=dir_path,
+                depth=level,
+                size_bytes=size,
+                file_count=files
+            ))
+
+    if progress is not None:
+        progress(entries_scanned, total_bytes)
+
+    return DiskUsageScan(
+        root=root,
+        total_bytes=root_node.size,
+        file_count=root_node.files,
+        dir_count=dir_count,
+        entries_scanned=entries_scanned,
+        error_count=error_count,
+        elapsed_seconds=round(time.monotonic() - start, 3),
+        partial=stop_reason is not None,
+        stop_reason=stop_reason,
+        directories=directories
+    )
@@ -0,0 +1,203 @@
+"""Streaming export of sampled metric history as NDJSON, CSV or Arrow IPC."""
+import csv
+import heapq
+import io
+import json
+import typing
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+from core.models import MemoryInfo, StorageInfo, BatteryInfo
+from utils.sampling import AdaptiveSampler
+
+EXPORT_FORMATS = ("ndjson", "csv", "arrow")
+
+# Model exported for each sampled metric
+METRIC_MODELS = {
+    "memory": MemoryInfo,
+    "storage": StorageInfo,
+    "battery": BatteryInfo,
+}
+
+# Union of all metric fields, used as the fixed CSV/Arrow column set
+COLUMNS = ["timestamp", "metric"] + list(dict.fromkeys(
+    name for model in METRIC_MODELS.values() for name in model.model_fields
+))
+
+CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+
+def _metric_rows(
+    sampler: AdaptiveSampler,
+    metric: str,
+    start: Optional[float],
+    end: Optional[float],
+    chunk_size: int
+) -> Iterator[Dict[str, Any]]:
+    """Flatten a metric's history into rows, oldest first."""
+    for chunk in sampler.iter_history(metric, start=start, end=end, chunk_size=chunk_size):
+        for timestamp, sample in chunk:
+            # Storage samples hold one entry per mount point
+            for item in sample if isinstance(sample, list) else (sample,):
+                row = {"timestamp": timestamp, "metric": metric}
+                row.update(item.model_dump())
+                yield row
+
+
+def iter_samples(
+    sampler: AdaptiveSampler,
+    metrics: Optional[Sequence[str]] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    chunk_size: int = 500
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Stream sampled history as chunks of flat rows, ordered by timestamp.
+
+    Args:
+        metrics: Metrics to export (all if None)
+        start: Only samples at or after this unix timestamp
+        end: Only samples before this unix timestamp
+        chunk_size: Maximum number of rows per chunk
+
+    Returns:
+        Iterator[List[Dict[str, Any]]]: Chunks of rows with "timestamp", "metric"
+        and the metric's fields
+
+    Raises:
+        ValueError: If a metric is unknown
+    """
+    metrics = list(metrics) if metrics else list(METRIC_MODELS)
+    for metric in metrics:
+        if metric not in METRIC_MODELS:
+            raise ValueError(f"Unknown metric: {metric}")
+    return _iter_chunks(sampler, metrics, start, end, chunk_size)
+
+
+def _iter_chunks(
+    sampler: AdaptiveSampler,
+    metrics: List[str],
+    start: Optional[float],
+    end: Optional[float],
+    chunk_size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    rows = heapq.merge(
+        *(_metric_rows(sampler, metric, start, end, chunk_size) for metric in metrics),
+        key=lambda row: row["timestamp"]
+    )
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def encode_chunks(chunks: Iterable[List[Dict[str, Any]]], export_format: str = "ndjson") -> Iterator[bytes]:
+    """
+    Encode row chunks incrementally.
+
+    Args:
+        chunks: Row chunks from iter_samples
+        export_format: "ndjson", "csv" or "arrow" (Arrow IPC stream, requires pyarrow)
+
+    Returns:
+        Iterator[bytes]: Encoded data, one piece per chunk
+
+    Raises:
+        ValueError: If the format is unknown
+        ImportError: If the arrow format is requested without pyarrow installed
+    """
+    if export_format == "ndjson":
+        return _encode_ndjson(chunks)
+    elif export_format == "csv":
+        return _encode_csv(chunks)
+    elif export_format == "arrow":
+        # Resolve the schema now so a missing pyarrow fails before streaming starts
+        return _encode_arrow(chunks, arrow_schema())
+    else:
+        raise ValueError(f"Unsupported export format: {export_format}")
+
+
+def iter_export(
+    sampler: AdaptiveSampler,
+    export_format: str = "ndjson",
+    metrics: Optional[Sequence[str]] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    chunk_size: int = 500
+) -> Iterator[bytes]:
+    """
+    Stream sampled history encoded in the given format.
+
+    Memory use depends on chunk_size, not on the size of the time range.
+
+    Returns:
+        Iterator[bytes]: Encoded data chunks
+    """
+    return encode_chunks(iter_samples(sampler, metrics, start, end, chunk_size), export_format)
+
+
+def _encode_ndjson(chunks: Iterable[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    for chunk in chunks:
+        yield "".join(json.dumps(row, separators=(",", ":")) + "\n" for row in chunk).encode()
+
+
+def _encode_csv(chunks: Iterable[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=COLUMNS, lineterminator="\n")
+    writer.writeheader()
+    for chunk in chunks:
+        writer.writerows(chunk)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # Header only, nothing was exported
+        yield buffer.getvalue().encode()
+
+
+def _arrow_type(pa, annotation):
+    """Map a model field annotation to an Arrow type."""
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    python_type = args[0] if args else annotation
+    return {
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float64(),
+    }.get(python_type, pa.string())
+
+
+def arrow_schema():
+    """
+    Get the Arrow schema of exported rows.
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("Arrow export requires pyarrow (pip install pyarrow)")
+
+    types = {"timestamp": pa.float64(), "metric": pa.string()}
+    for model in METRIC_MODELS.values():
+        for name, field in model.model_fields.items():
+            types.setdefault(name, _arrow_type(pa, field.annotation))
+    return pa.schema([(name, types[name]) for name in COLUMNS])
+
+
+def _encode_arrow(chunks: Iterable[List[Dict[str, Any]]], schema) -> Iterator[bytes]:
+    import pyarrow as pa
+
+    buffer = io.BytesIO()
+    with pa.ipc.new_stream(buffer, schema) as writer:
+        for chunk in chunks:
+            writer.write_batch(pa.RecordBatch.from_pylist(chunk, schema=schema))
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    # End-of-stream marker (and the schema if nothing was exported)
+    yield buffer.getvalue()
@@ -0,0 +1,371 @@
+"""On-demand cProfile/tracemalloc profiling of tool calls."""
+import cProfile
+import functools
+import inspect
+import io
+import pstats
+import threading
+import time
+import tracemalloc
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+from core.models import ProfiledFunction, AllocationSite, ProfileReport
+
+
+class _ToolProfile:
+    """Aggregated profiling data for one tool."""
+
+    def __init__(self, calls: int):
+        self.remaining = calls
+        self.profiled = 0
+        self.total_seconds = 0.0
+        self.stats: Optional[pstats.Stats] = None
+        # (file, line) -> [net bytes, net blocks]
+        self.allocations: Dict[Tuple[str, int], list] = {}
+        # Thread id -> cProfile of work bound in worker threads of a profiled call
+        self.thread_profiles: Dict[int, cProfile.Profile] = {}
+
+
+class ToolProfiler:
+    """
+    Profile the next N calls of a named tool.
+
+    Tools are wrapped once at registration with :meth:`wrap`. While no tool is
+    armed the wrapper is a single dict lookup before calling straight through,
+    so profiling costs nothing until it is requested.
+
+    cProfile only sees the thread it runs in, and an async tool spends most of
+    its time awaiting, so async tools are not profiled across their awaits.
+    Instead, sync tools they call directly and blocking work they hand to a
+    thread through :meth:`bind` are profiled as part of the async tool. Work
+    that bound code fans out to a thread pool is covered too if the pool's
+    task function is also bound and runs in a copy of the caller's context
+    (see utils.disk_usage). Allocation sites are tracked for the outermost
+    bound call only.
+    """
+
+    def __init__(self):
+        self._armed: Dict[str, int] = {}
+        self._profiles: Dict[str, _ToolProfile] = {}
+        self._tools: Set[str] = set()
+        self._lock = threading.Lock()
+        self._active = False
+        # Thread holding the cProfile slot, and worker threads being profiled
+        self._active_thread: Optional[int] = None
+        self._worker_threads: Set[int] = set()
+        self._started_tracemalloc = False
+        # Profile of the async tool call running in the current context
+        self._current: ContextVar[Optional[_ToolProfile]] = ContextVar(
+            f"tool_profile_{id(self)}", default=None
+        )
+        self._async_running = 0
+
+    @property
+    def tools(self) -> Set[str]:
+        """Names of the tools that can be profiled."""
+        return set(self._tools)
+
+    def wrap(self, fn: Callable) -> Callable:
+        """
+        Make a tool function profilable.
+
+        Args:
+            fn: Tool function (sync or async)
+
+        Returns:
+            Callable: Wrapper with the same signature as fn
+        """
+        name = fn.__name__
+        self._tools.add(name)
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if name not in self._armed:
+                    return await fn(*args, **kwargs)
+                return await self._profile_async(name, fn, args, kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if name not in self._armed and not self._async_running:
+                return fn(*args, **kwargs)
+            return self._profile_call(name, fn, args, kwargs)
+        return wrapper
+
+    def bind(self, fn: Callable) -> Callable:
+        """
+        Wrap blocking work that an async tool runs in a worker thread.
+
+        When the calling async tool is being profiled, fn is profiled as part
+        of it. asyncio.to_thread copies the caller's context into the worker,
+        which is how the profile is found there. Bound functions called from
+        further worker threads (with the context copied) are profiled with a
+        cProfile per thread, merged into the tool's report.
+
+        Args:
+            fn: Sync function, e.g. the one passed to asyncio.to_thread
+
+        Returns:
+            Callable: Wrapper with the same signature as fn
+        """
+        @functools.wraps(fn)
+        def bound(*args, **kwargs):
+            profile = self._current.get()
+            if profile is None:
+                return fn(*args, **kwargs)
+            if self._acquire():
+                return self._profiled(profile, fn, args, kwargs)
+            if self._active_thread == threading.get_ident():
+                # Nested in the profile already running in this thread
+                return fn(*args, **kwargs)
+            return self._profile_worker(profile, fn, args, kwargs)
+        return bound
+
+    def arm(self, tool_name: str, calls: int = 1) -> None:
+        """
+        Profile the next calls of a tool, discarding any earlier profile of it.
+
+        Args:
+            tool_name: Name of the tool to profile
+            calls: Number of upcoming calls to profile
+
+        Raises:
+            ValueError: If the tool is unknown or calls is not positive
+        """
+        if tool_name not in self._tools:
+            raise ValueError(f"Unknown tool: {tool_name}")
+        if calls < 1:
+            raise ValueError("calls must be at least 1")
+
+        with self._lock:
+            self._profiles[tool_name] = _ToolProfile(calls)
+            self._armed[tool_name] = calls
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+
+    def report(self, tool_name: str, top_n: int = 20) -> ProfileReport:
+        """
+        Get the aggregated profile of a tool.
+
+        Args:
+            tool_name: Name of the profiled tool
+            top_n: Number of hot functions and allocation sites to report
+
+        Returns:
+            ProfileReport: Aggregated profile
+
+        Raises:
+            ValueError: If the tool has not been armed for profiling
+        """
+        profile = self._profiles.get(tool_name)
+        if profile is None:
+            raise ValueError(f"Tool has not been profiled: {tool_name}")
+
+        hot_functions = []
+        if profile.stats is not None:
+            entries = sorted(
+                # Leave out the profiler's own wrapper frames
+                (item for item in profile.stats.stats.items() if item[0][0] != __file__),
+                key=lambda item: item[1][3],  # Cumulative time
+                reverse=True
+            )
+            for (file, line, function), (_, calls, total, cumulative, _) in entries[:top_n]:
+                hot_functions.append(ProfiledFunction(
+                    function=function,
+                    file=file,
+                    line=line,
+                    calls=calls,
+                    total_seconds=round(total, 6),
+                    cumulative_seconds=round(cumulative, 6)
+                ))
+
+        sites = sorted(profile.allocations.items(), key=lambda item: item[1][0], reverse=True)
+        allocation_sites = [
+            AllocationSite(file=file, line=line, size_bytes=size, count=count)
+            for (file, line), (size, count) in sites[:top_n]
+            if size > 0
+        ]
+
+        return ProfileReport(
+            tool=tool_name,
+            calls_profiled=profile.profiled,
+            calls_remaining=profile.remaining,
+            total_seconds=round(profile.total_seconds, 6),
+            hot_functions=hot_functions,
+            allocation_sites=allocation_sites
+        )
+
+    def _acquire(self) -> bool:
+        """Take the single cProfile slot, or return False if it is in use."""
+        with self._lock:
+            # Only one cProfile can be active at a time, so nested and
+            # concurrent calls run unprofiled
+            if self._active:
+                return False
+            self._active = True
+            self._active_thread = threading.get_ident()
+            return True
+
+    def _claim(self, name: str) -> Optional[_ToolProfile]:
+        """Take one armed call for the tool, or None if it is not armed."""
+        with self._lock:
+            if name not in self._armed:
+                return None
+            self._armed[name] -= 1
+            if self._armed[name] == 0:
+                del self._armed[name]
+            return self._profiles[name]
+
+    def _run_profiled(self, profile: _ToolProfile, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        """Run fn under cProfile and tracemalloc, adding the results to profile."""
+        if not self._acquire():
+            return fn(*args, **kwargs)
+        return self._profiled(profile, fn, args, kwargs)
+
+    def _profiled(self, profile: _ToolProfile, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        """Like _run_profiled, for a caller that already holds the cProfile slot."""
+        try:
+            snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+            profiler = cProfile.Profile()
+            profiler.enable()
+        except BaseException:
+            self._release()
+            raise
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profiler.disable()
+            self._record(profile, profiler, snapshot)
+
+    def _profile_worker(self, profile: _ToolProfile, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        """Run fn under this thread's cProfile for the profile, without tracemalloc."""
+        ident = threading.get_ident()
+        with self._lock:
+            if ident in self._worker_threads:
+                # Nested bound call in this worker
+                busy = True
+            else:
+                busy = False
+                self._worker_threads.add(ident)
+                worker = profile.thread_profiles.get(ident)
+        if busy:
+            return fn(*args, **kwargs)
+
+        try:
+            if worker is None:
+                worker = cProfile.Profile()
+                try:
+                    worker.enable()
+                except ValueError:
+                    # Python 3.12+ allows a single active profiler, which
+                    # already sees every thread
+                    return fn(*args, **kwargs)
+                with self._lock:
+                    profile.thread_profiles[ident] = worker
+            else:
+                worker.enable()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                worker.disable()
+        finally:
+            with self._lock:
+                self._worker_threads.discard(ident)
+
+    def _merge_thread_profiles(self, profile: _ToolProfile, stats: pstats.Stats) -> None:
+        """Add the finished worker thread profiles to stats."""
+        with self._lock:
+            idle = [
+                profile.thread_profiles.pop(ident) for ident in list(profile.thread_profiles)
+                if ident not in self._worker_threads
+            ]
+        for worker in idle:
+            stats.add(pstats.Stats(worker, stream=io.StringIO()))
+
+    def _record(self, profile: _ToolProfile, profiler: cProfile.Profile, snapshot: Any) -> None:
+        stats = pstats.Stats(profiler, stream=io.StringIO())
+        self._merge_thread_profiles(profile, stats)
+
+        if snapshot is not None and tracemalloc.is_tracing():
+            # Other threads keep allocating while fn runs; only keep allocation
+            # sites in files whose code ran during this profile
+            files = {file for file, _, _ in stats.stats}
+            after = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ])
+            for stat in after.compare_to(snapshot, 'lineno'):
+                frame = stat.traceback[0]
+                if stat.size_diff == 0 or frame.filename not in files:
+                    continue
+                site = profile.allocations.setdefault((frame.filename, frame.lineno), [0, 0])
+                site[0] += stat.size_diff
+                site[1] += stat.count_diff
+
+        with self._lock:
+            if profile.stats is None:
+                profile.stats = stats
+            else:
+                profile.stats.add(stats)
+        self._release()
+
+    def _release(self) -> None:
+        with self._lock:
+            self._active = False
+            self._active_thread = None
+            self._stop_tracemalloc()
+
+    def _finish(self, profile: _ToolProfile, elapsed: float) -> None:
+        """Count one profiled call of a tool."""
+        with self._lock:
+            profile.profiled += 1
+            profile.remaining -= 1
+            profile.total_seconds += elapsed
+            self._stop_tracemalloc()
+
+    def _stop_tracemalloc(self) -> None:
+        """Stop tracemalloc once nothing is armed or being profiled (lock held)."""
+        if (
+            self._started_tracemalloc and not self._armed
+            and not self._active and not self._async_running
+        ):
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _profile_call(self, name: str, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        outer = self._current.get()
+        if outer is not None:
+            # Called directly by a profiled async tool; part of that tool's work
+            return self._run_profiled(outer, fn, args, kwargs)
+
+        if not self._acquire():
+            return fn(*args, **kwargs)
+        profile = self._claim(name)
+        if profile is None:
+            self._release()
+            return fn(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return self._profiled(profile, fn, args, kwargs)
+        finally:
+            self._finish(profile, time.perf_counter() - start)
+
+    async def _profile_async(self, name: str, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        profile = self._claim(name)
+        if profile is None:
+            return await fn(*args, **kwargs)
+
+        with self._lock:
+            self._async_running += 1
+        token = self._current.set(profile)
+        start = time.perf_counter()
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            self._current.reset(token)
+            with self._lock:
+                self._async_running -= 1
+            self._finish(profile, time.perf_counter() - start)
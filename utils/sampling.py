@@ -0,0 +1,332 @@
+"""Adaptive, power-aware background sampling of device metrics."""
+import threading
+import time
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+from core.base import DeviceInfoProvider
+from core.models import BatteryInfo, MetricSamplingRate, SamplingReport
+
+# Default (min interval, max interval, initial interval, tolerance) per metric.
+# Tolerance is the change in percentage points treated as "moving".
+DEFAULT_SCHEDULES = {
+    "memory": (5.0, 300.0, 30.0, 1.0),
+    "storage": (60.0, 3600.0, 300.0, 0.5),
+    "battery": (30.0, 900.0, 60.0, 1.0),
+}
+
+
+def _max_storage_usage(storage_list) -> Optional[float]:
+    """Usage percentage of the fullest mount point."""
+    return max((storage.usage_percent for storage in storage_list), default=None)
+
+
+class MetricSchedule:
+    """Sampling schedule of one metric."""
+
+    def __init__(
+        self,
+        name: str,
+        collect: Callable[[], Any],
+        value: Callable[[Any], Optional[float]],
+        min_interval: float,
+        max_interval: float,
+        initial_interval: float,
+        tolerance: float
+    ):
+        self.name = name
+        self.collect = collect
+        self.value = value
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.tolerance = tolerance
+        # Interval chosen from the metric's rate of change, before power scaling
+        self.base_interval = min(max(initial_interval, min_interval), max_interval)
+        self.interval = self.base_interval
+        self.next_due = 0.0
+        self.sample_count = 0
+        self.last_value: Optional[float] = None
+
+
+class AdaptiveSampler:
+    """
+    Sample device metrics at intervals that follow how fast they change.
+
+    Each metric starts at its initial interval. When a sample moves by more than
+    the metric's tolerance the interval is halved (down to its floor); while it
+    stays stable the interval grows by half (up to its ceiling). When the last
+    battery sample shows the device running on battery, every interval is
+    stretched by ``battery_factor``, still within its floor and ceiling.
+
+    Samples are kept in a bounded per-metric history.
+    """
+
+    def __init__(
+        self,
+        provider: DeviceInfoProvider,
+        schedules: Optional[Dict[str, Tuple[float, float, float, float]]] = None,
+        backoff_factor: float = 1.5,
+        tighten_factor: float = 0.5,
+        battery_factor: float = 4.0,
+        history_size: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            provider: Device provider to sample
+            schedules: Per-metric (min interval, max interval, initial interval,
+                tolerance); defaults to DEFAULT_SCHEDULES
+            backoff_factor: Interval multiplier while a metric is stable
+            tighten_factor: Interval multiplier when a metric moves
+            battery_factor: Interval multiplier while running on battery
+            history_size: Number of samples kept per metric
+            clock: Monotonic clock used for scheduling
+            wall_clock: Clock used to timestamp samples
+        """
+        collectors = {
+            "memory": (provider.get_memory_info, lambda memory: memory.usage_percent),
+            "storage": (provider.get_storage_info, _max_storage_usage),
+            "battery": (provider.get_battery_level, lambda battery: battery.percentage),
+        }
+
+        self.backoff_factor = backoff_factor
+        self.tighten_factor = tighten_factor
+        self.battery_factor = battery_factor
+        self.on_battery = False
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        # Set to make the sampling thread recompute its sleep (configure, stop)
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._schedules: Dict[str, MetricSchedule] = {}
+        self._history: Dict[str, Deque[Tuple[float, Any]]] = {}
+        # Number of samples ever appended per metric, to page through history
+        self._appended: Dict[str, int] = {}
+
+        for name, (min_interval, max_interval, initial, tolerance) in (
+            schedules or DEFAULT_SCHEDULES
+        ).items():
+            if name not in collectors:
+                raise ValueError(f"Unknown metric: {name}")
+            collect, value = collectors[name]
+            self._schedules[name] = MetricSchedule(
+                name, collect, value, min_interval, max_interval, initial, tolerance
+            )
+            self._history[name] = deque(maxlen=history_size)
+            self._appended[name] = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether background sampling is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._wake.clear()
+        self._thread = threading.Thread(target=self._run, name="AdaptiveSampler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop background sampling."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def configure(
+        self,
+        metric: str,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None
+    ) -> None:
+        """
+        Change the interval floor and/or ceiling of a metric.
+
+        Args:
+            metric: Metric name
+            min_interval: New interval floor in seconds
+            max_interval: New interval ceiling in seconds
+
+        Raises:
+            ValueError: If the metric is unknown or the bounds are invalid
+        """
+        schedule = self._schedules.get(metric)
+        if schedule is None:
+            raise ValueError(f"Unknown metric: {metric}")
+
+        with self._lock:
+            low = schedule.min_interval if min_interval is None else min_interval
+            high = schedule.max_interval if max_interval is None else max_interval
+            if low <= 0 or high < low:
+                raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval")
+            schedule.min_interval = low
+            schedule.max_interval = high
+            schedule.base_interval = min(max(schedule.base_interval, low), high)
+            self._update_interval(schedule)
+            schedule.next_due = min(schedule.next_due, self._clock() + schedule.interval)
+        # The sampling thread may be sleeping until the old next_due
+        self._wake.set()
+
+    def run_pending(self) -> float:
+        """
+        Take every sample that is due.
+
+        Returns:
+            float: Seconds until the next sample is due
+        """
+        now = self._clock()
+        for schedule in list(self._schedules.values()):
+            if schedule.next_due <= now:
+                self._sample(schedule, now)
+
+        with self._lock:
+            next_due = min(schedule.next_due for schedule in self._schedules.values())
+        return max(next_due - self._clock(), 0.0)
+
+    def history(self, metric: str) -> List[Tuple[float, Any]]:
+        """
+        Get the kept samples of a metric, oldest first.
+
+        Args:
+            metric: Metric name
+
+        Returns:
+            List[Tuple[float, Any]]: (unix timestamp, sample model) pairs
+        """
+        with self._lock:
+            return list(self._history[metric])
+
+    def iter_history(
+        self,
+        metric: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        chunk_size: int = 500
+    ) -> Iterator[List[Tuple[float, Any]]]:
+        """
+        Page through the kept samples of a metric without copying the whole history.
+
+        The lock is only held while copying one chunk, so sampling continues
+        during a long export. Samples evicted before they are reached are skipped.
+
+        Args:
+            metric: Metric name
+            start: Only samples at or after this unix timestamp
+            end: Only samples before this unix timestamp
+            chunk_size: Maximum number of samples per chunk
+
+        Yields:
+            List[Tuple[float, Any]]: Chunks of (unix timestamp, sample model) pairs
+
+        Raises:
+            ValueError: If the metric is unknown
+        """
+        if metric not in self._history:
+            raise ValueError(f"Unknown metric: {metric}")
+
+        next_sequence = 0
+        while True:
+            with self._lock:
+                history = self._history[metric]
+                first_sequence = self._appended[metric] - len(history)
+                next_sequence = max(next_sequence, first_sequence)
+                offset = next_sequence - first_sequence
+                chunk = list(islice(history, offset, offset + chunk_size))
+            if not chunk:
+                return
+            next_sequence += len(chunk)
+
+            selected = [
+                (timestamp, sample) for timestamp, sample in chunk
+                if (start is None or timestamp >= start) and (end is None or timestamp < end)
+            ]
+            if selected:
+                yield selected
+            if end is not None and chunk[-1][0] >= end:
+                return
+
+    def report(self) -> SamplingReport:
+        """
+        Get the effective sampling rate of each metric.
+
+        Returns:
+            SamplingReport: Sampler state
+        """
+        with self._lock:
+            return SamplingReport(
+                running=self.running,
+                on_battery=self.on_battery,
+                metrics=[
+                    MetricSamplingRate(
+                        metric=schedule.name,
+                        interval_seconds=round(schedule.interval, 3),
+                        min_interval_seconds=schedule.min_interval,
+                        max_interval_seconds=schedule.max_interval,
+                        samples_per_minute=round(60.0 / schedule.interval, 3),
+                        sample_count=schedule.sample_count,
+                        last_value=schedule.last_value
+                    )
+                    for schedule in self._schedules.values()
+                ]
+            )
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.run_pending())
+            self._wake.clear()
+
+    def _sample(self, schedule: MetricSchedule, now: float) -> None:
+        try:
+            sample = schedule.collect()
+            value = schedule.value(sample)
+        except Exception:
+            # Treat a failed probe as "no change" so a broken source backs off
+            sample, value = None, schedule.last_value
+
+        with self._lock:
+            if sample is not None:
+                self._history[schedule.name].append((self._wall_clock(), sample))
+                self._appended[schedule.name] += 1
+            power_changed = False
+            if isinstance(sample, BatteryInfo):
+                on_battery = sample.has_battery and sample.is_plugged is False
+                power_changed = on_battery != self.on_battery
+                self.on_battery = on_battery
+
+            previous = schedule.last_value
+            moved = (
+                value is not None and previous is not None
+                and abs(value - previous) > schedule.tolerance
+            )
+            if moved:
+                schedule.base_interval = max(
+                    schedule.base_interval * self.tighten_factor, schedule.min_interval
+                )
+            elif schedule.sample_count > 0:
+                schedule.base_interval = min(
+                    schedule.base_interval * self.backoff_factor, schedule.max_interval
+                )
+
+            schedule.last_value = value
+            schedule.sample_count += 1
+            for other in self._schedules.values():
+                previous_interval = other.interval
+                self._update_interval(other)
+                if power_changed and other is not schedule and other.sample_count:
+                    # Reschedule from the metric's last sample at its new interval
+                    other.next_due += other.interval - previous_interval
+            schedule.next_due = now + schedule.interval
+
+    def _update_interval(self, schedule: MetricSchedule) -> None:
+        """Apply the power state to a metric's base interval."""
+        interval = schedule.base_interval
+        if self.on_battery:
+            interval *= self.battery_factor
+        schedule.interval = min(max(interval, schedule.min_interval), schedule.max_interval)